@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -19,25 +20,23 @@ class WebhookEventDTO(BaseModel):
                 text = message.get("text")
                 mid = message.get("mid")
                 sender = (msg.get("sender") or {}).get("id")
-                recipient = (msg.get("recipient") or {}).get("id")
                 timestamp = msg.get("timestamp")
 
                 if not (mid and sender and text and timestamp):
                     continue
 
-                thread_id = str(sender)
+                # Senders repeat across events; interning shares one string per
+                # user for the thread id, the sender id and the store's dict keys.
+                sender_id = sys.intern(str(sender))
                 messages.append(
                     Message(
                         id=str(mid),
-                        thread_id=thread_id,
-                        sender_id=str(sender),
+                        thread_id=sender_id,
+                        sender_id=sender_id,
                         text=str(text),
                         timestamp=int(timestamp),
                         platform="instagram",
                     )
                 )
 
-                if recipient:
-                    _ = str(recipient)
-
         return messages
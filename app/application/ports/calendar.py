@@ -21,6 +21,19 @@ class CalendarPort(ABC):
         """Find available time slots for a given date and duration."""
         raise NotImplementedError
 
+    def find_available_slots_batch(
+        self,
+        dates: list[date],
+        duration_minutes: int,
+        start_hour: int = 9,
+        end_hour: int = 17,
+    ) -> dict[date, list[datetime]]:
+        """Find available slots for several dates. Adapters may override with a single lookup."""
+        return {
+            day: self.find_available_slots(day, duration_minutes, start_hour, end_hour)
+            for day in dates
+        }
+
     @abstractmethod
     def create_event(
         self,
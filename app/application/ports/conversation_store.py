@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Mapping
 
 from app.domain.entities.conversation_state import ConversationState
 
@@ -10,7 +10,7 @@ class ConversationStorePort(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def append_message(self, thread_id: str, role: str, text: str, meta: dict[str, Any] | None = None) -> None:
+    def append_message(self, thread_id: str, role: str, text: str, meta: Mapping[str, Any] | None = None) -> None:
         raise NotImplementedError
 
     @abstractmethod
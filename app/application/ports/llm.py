@@ -11,3 +11,6 @@ class LLMPort(ABC):
         language_hint: str | None,
     ) -> IntentClassification:
         raise NotImplementedError
+
+    def prewarm(self) -> None:
+        """Open upstream connections ahead of the first request. Adapters may override."""
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
@@ -17,7 +18,26 @@ from app.domain.entities.booking_state import BookingState
 from app.domain.entities.conversation_state import ConversationState
 
 
-@dataclass(frozen=True)
+_CONFIRMATIONS = (
+    "yes",
+    "yeah",
+    "yep",
+    "sure",
+    "ok",
+    "okay",
+    "confirm",
+    "book it",
+    "si",
+    "sí",
+    "claro",
+    "vale",
+    "confirmar",
+)
+
+_CONFIRMATION_RE = re.compile("|".join(map(re.escape, _CONFIRMATIONS)))
+
+
+@dataclass(frozen=True, slots=True)
 class BookingResult:
     action: str
     message: str | None
@@ -152,7 +172,7 @@ class BookingUseCase:
                 proposed_slots=slots[:2],
                 updated_state=BookingState(
                     status="collecting_time",
-                    proposed_date=datetime.combine(parsed_date, datetime.min.time(), tzinfo=self._timezone),
+                    proposed_date=datetime(parsed_date.year, parsed_date.month, parsed_date.day, tzinfo=self._timezone),
                     service_key=service,
                 ),
             )
@@ -164,7 +184,7 @@ class BookingUseCase:
             proposed_slots=[slot],
             updated_state=BookingState(
                 status="collecting_time",
-                proposed_date=datetime.combine(parsed_date, datetime.min.time(), tzinfo=self._timezone),
+                proposed_date=datetime(parsed_date.year, parsed_date.month, parsed_date.day, tzinfo=self._timezone),
                 service=service,
             ),
         )
@@ -180,7 +200,6 @@ class BookingUseCase:
             return self._start_booking_flow(service, language)
 
         parsed_time = parse_time_preference(message_text)
-        vague_range = map_vague_time_to_range(message_text)
 
         if parsed_time:
             hour, minute = parsed_time
@@ -215,6 +234,7 @@ class BookingUseCase:
                     updated_state=current_state,
                 )
 
+        vague_range = map_vague_time_to_range(message_text)
         if vague_range:
             start_hour, end_hour = vague_range
             duration = self._get_service_duration(service)
@@ -311,22 +331,7 @@ class BookingUseCase:
         return f"Would you like me to book {service_name} on {date_str} at {time_str}?"
 
     def _is_confirmation(self, text: str) -> bool:
-        confirmations = (
-            "yes",
-            "yeah",
-            "yep",
-            "sure",
-            "ok",
-            "okay",
-            "confirm",
-            "book it",
-            "si",
-            "sí",
-            "claro",
-            "vale",
-            "confirmar",
-        )
-        return any(conf in text for conf in confirmations)
+        return _CONFIRMATION_RE.search(text) is not None
 
     def _get_service_duration(self, service: str | None) -> int:
         if not service:
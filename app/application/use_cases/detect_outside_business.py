@@ -21,7 +21,7 @@ ALLOWED_INTENTS = {
 }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OutsideBusinessDecision:
     should_handoff: bool
     reason: str
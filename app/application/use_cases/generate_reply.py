@@ -49,6 +49,6 @@ class GenerateReplyUseCase:
                 "Reply validation failed",
                 extra={"reason": composed.error, "intent": intent, "service": service, "language": language},
             )
-            return Reply(text="", should_handoff=True, handoff_reason=composed.error, meta={})
+            return Reply(text="", should_handoff=True, handoff_reason=composed.error)
 
-        return Reply(text=composed.text, should_handoff=False, handoff_reason="", meta={})
+        return Reply(text=composed.text, should_handoff=False, handoff_reason="")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
@@ -41,6 +42,8 @@ from app.core.config import settings
 from app.domain.entities.conversation_state import ConversationState
 from app.domain.entities.message import Message
 
+_CANCEL_RE = re.compile("cancel|stop|never mind|no thanks|cancelar|no gracias")
+
 
 class HandleIncomingMessageUseCase:
     def __init__(
@@ -154,9 +157,7 @@ class HandleIncomingMessageUseCase:
                 # In booking flow - route ONLY through BookingUseCase
                 in_booking_flow = True
                 # Check for explicit cancellation
-                normalized = message.text.lower().strip()
-                cancel_keywords = ("cancel", "stop", "never mind", "no thanks", "cancelar", "no gracias")
-                if any(keyword in normalized for keyword in cancel_keywords):
+                if _CANCEL_RE.search(message.text.lower().strip()):
                     state = reset_booking_state(state)
                     self._store.set_state(message.thread_id, state)
                     # After cancellation, fall through to normal flow to generate a reply
@@ -190,6 +191,7 @@ class HandleIncomingMessageUseCase:
                     message_text=message.text,
                     current_state=state.selection_state,
                     language=context.resolved_language,
+                    pre_resolved=context.text_service_key,
                 )
                 new_selection_state = selection_result.updated_state
                 state = ConversationState(
@@ -291,7 +293,8 @@ class HandleIncomingMessageUseCase:
             )
             
             # Service registry match beats LLM intent
-            resolved_service = context.resolved_service_key or self._kb.resolve_service_to_registry_key(message.text)
+            # resolve_context already ran the registry lookup on message.text
+            resolved_service = context.resolved_service_key
             booking_request = context.is_booking_request
             
             self._logger.info(
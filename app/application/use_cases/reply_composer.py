@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 
 from app.application.ports.knowledge_base import KnowledgeBasePort
@@ -20,7 +21,27 @@ CTA_SIGNATURES = (
 )
 
 
-@dataclass(frozen=True)
+_PRICING_RE = re.compile(r"(?:Pricing|Precio):\s*\$[0-9]+(?:[–-][0-9]+)?")
+_PRICING_CUE_RE = re.compile(r"(?:Pricing|Precio):\s*\$")
+_YESNO_PRICING_RE = re.compile(r"\s*(?:Pricing|Precio):\s*\$[0-9]+(?:–[0-9]+)?")
+_WHITESPACE_RE = re.compile(r"\s+")
+_YESNO_PREFIX_RE = re.compile(r"^(Yes,|Si,|Hello,|Hola,|Hi,|Hey,|Yes\.|Si\.)", re.IGNORECASE)
+_GREETING_FORBIDDEN = (
+    (re.compile(r"\$", re.IGNORECASE), "pricing"),
+    (re.compile(r"Pricing|Precio", re.IGNORECASE), "pricing_keyword"),
+    (re.compile(r"service|servicio", re.IGNORECASE), "service_name"),
+    (re.compile(r"Which|Que.*interesa", re.IGNORECASE), "cta"),
+)
+_SESSION_FACTS_SERVICE_NAME_RE = re.compile(r"Full Body|Full Legs|Laser|Brazilian|Bikini", re.IGNORECASE)
+_SESSION_FACTS_GUARANTEE_RE = re.compile(r"guarantee|guaranteed|promise|will|always|never", re.IGNORECASE)
+
+_FALLBACK = {
+    "en": "We offer:\n• Laser Hair Removal\n• Facials & Skin Treatments\n• Lash Services\n• Eyebrow Services\n• Permanent Makeup\n• Combo Services\n\nWhich service are you interested in? ✨",
+    "es": "Ofrecemos:\n• Depilación Láser\n• Faciales y Tratamientos de Piel\n• Pestañas\n• Cejas\n• Maquillaje Permanente\n• Servicios Combinados\n\nQue servicio te interesa? ✨",
+}
+
+
+@dataclass(frozen=True, slots=True)
 class ComposedReply:
     text: str
     error: str | None = None
@@ -479,11 +500,10 @@ def _strip_pricing_from_yesno(text: str) -> str:
     Yes/No answers should only contain service name confirmation, not pricing.
     Pricing belongs in the detail block only.
     """
-    import re
     # Remove patterns like "Pricing: $X" or "Precio: $X"
-    text = re.sub(r"\s*(?:Pricing|Precio):\s*\$[0-9]+(?:–[0-9]+)?", "", text)
+    text = _YESNO_PRICING_RE.sub("", text)
     # Clean up any double spaces or trailing punctuation issues
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WHITESPACE_RE.sub(" ", text).strip()
     # Ensure it ends with a period if it's a yes/no answer
     if text and not text.endswith("."):
         text = text.rstrip(".,") + "."
@@ -497,8 +517,7 @@ def _validate_no_pricing_in_yesno(yesno_answer: str | None) -> bool:
     """
     if not yesno_answer:
         return True
-    import re
-    has_pricing = bool(re.search(r"(?:Pricing|Precio):\s*\$", yesno_answer))
+    has_pricing = bool(_PRICING_CUE_RE.search(yesno_answer))
     return not has_pricing
 
 
@@ -512,16 +531,9 @@ def _validate_greeting_block(text: str) -> tuple[bool, str]:
         return False, f"greeting_must_be_exact_got_{text!r}"
     
     # Check for forbidden content
-    forbidden_patterns = [
-        (r"\$", "pricing"),
-        (r"Pricing|Precio", "pricing_keyword"),
-        (r"service|servicio", "service_name"),
-        (r"Which|Que.*interesa", "cta"),
-    ]
     text_lower = text.lower()
-    for pattern, error_type in forbidden_patterns:
-        import re
-        if re.search(pattern, text_lower, re.IGNORECASE):
+    for pattern, error_type in _GREETING_FORBIDDEN:
+        if pattern.search(text_lower):
             return False, f"greeting_contains_{error_type}"
     
     return True, ""
@@ -538,22 +550,17 @@ def _validate_yesno_block(text: str) -> tuple[bool, str]:
     No pricing, no emojis.
     Returns (is_valid, error_message).
     """
-    import re
-    
     # More flexible pattern: must start with Yes/Si/Hello and end with period
     # Accepts various formats as long as it's a complete sentence ending with period
     if not text.strip().endswith("."):
         return False, "yesno_invalid_format"
     
     # Must start with common yes/no prefixes or greetings
-    yesno_prefixes = (
-        r"^(Yes,|Si,|Hello,|Hola,|Hi,|Hey,|Yes\.|Si\.)",
-    )
-    if not re.match(r"^(Yes,|Si,|Hello,|Hola,|Hi,|Hey,|Yes\.|Si\.)", text, re.IGNORECASE):
+    if not _YESNO_PREFIX_RE.match(text):
         return False, "yesno_invalid_format"
     
     # No pricing allowed
-    if re.search(r"(?:Pricing|Precio):\s*\$", text):
+    if _PRICING_CUE_RE.search(text):
         return False, "yesno_contains_pricing"
     
     # No emojis allowed
@@ -585,14 +592,12 @@ def _validate_cta_block(text: str, is_laser_service: bool = False, is_services_l
     No pricing, no service names.
     Returns (is_valid, error_message).
     """
-    import re
-    
     # Laser service or services_list CTA doesn't have emoji, so skip emoji validation
     if is_laser_service or is_services_list:
         # Just check it's not empty and doesn't contain pricing
         if not text.strip():
             return False, "cta_empty"
-        if re.search(r"(?:Pricing|Precio):\s*\$", text):
+        if _PRICING_CUE_RE.search(text):
             return False, "cta_contains_pricing"
         return True, ""
     
@@ -607,7 +612,7 @@ def _validate_cta_block(text: str, is_laser_service: bool = False, is_services_l
         return False, f"cta_emoji_count_{emoji_count}_not_one"
     
     # No pricing allowed
-    if re.search(r"(?:Pricing|Precio):\s*\$", text):
+    if _PRICING_CUE_RE.search(text):
         return False, "cta_contains_pricing"
     
     # No service names (basic check)
@@ -631,8 +636,6 @@ def _validate_service_name_repetition(reply_text: str, has_yesno: bool) -> str |
     Note: This validation is lenient - it checks for obvious repetition but allows
     service names that appear as part of combo services or natural text flow.
     """
-    import re
-    
     # Split into paragraphs to check for repetition across blocks
     paragraphs = [p.strip() for p in reply_text.split("\n\n") if p.strip()]
     
@@ -668,10 +671,8 @@ def _count_pricing_occurrences(text: str) -> int:
     Count how many times pricing appears in the text.
     Pricing should appear only once (in detail block).
     """
-    import re
     # Count "Pricing: $X" or "Precio: $X" patterns
-    pricing_matches = re.findall(r"(?:Pricing|Precio):\s*\$[0-9]+(?:–[0-9]+)?", text)
-    return len(pricing_matches)
+    return sum(1 for _ in _PRICING_RE.finditer(text))
 
 
 def _validate_session_facts_block(text: str) -> tuple[bool, str]:
@@ -679,10 +680,8 @@ def _validate_session_facts_block(text: str) -> tuple[bool, str]:
     Validate session facts block: no pricing, no service names, neutral language.
     Returns (is_valid, error_message).
     """
-    import re
-    
     # No pricing allowed
-    if re.search(r"(?:Pricing|Precio):\s*\$", text):
+    if _PRICING_CUE_RE.search(text):
         return False, "session_facts_contains_pricing"
     
     # No dollar signs
@@ -691,29 +690,12 @@ def _validate_session_facts_block(text: str) -> tuple[bool, str]:
     
     # No service names (to avoid duplication)
     # Check for common service name patterns
-    service_name_patterns = (
-        r"Full Body",
-        r"Full Legs",
-        r"Laser",
-        r"Brazilian",
-        r"Bikini",
-    )
-    for pattern in service_name_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            return False, "session_facts_contains_service_name"
+    if _SESSION_FACTS_SERVICE_NAME_RE.search(text):
+        return False, "session_facts_contains_service_name"
     
     # No guarantees or promotional language
-    guarantee_patterns = (
-        r"guarantee",
-        r"guaranteed",
-        r"promise",
-        r"will",
-        r"always",
-        r"never",
-    )
-    for pattern in guarantee_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            return False, "session_facts_contains_guarantee"
+    if _SESSION_FACTS_GUARANTEE_RE.search(text):
+        return False, "session_facts_contains_guarantee"
     
     # No emojis allowed
     if any(emoji in text for emoji in ["🤍", "✨", "☀️", "💕", "💆", "📍"]):
@@ -723,6 +705,4 @@ def _validate_session_facts_block(text: str) -> tuple[bool, str]:
 
 
 def _get_fallback_services_list(language: str) -> str:
-    if language == "es":
-        return "Ofrecemos:\n• Depilación Láser\n• Faciales y Tratamientos de Piel\n• Pestañas\n• Cejas\n• Maquillaje Permanente\n• Servicios Combinados\n\nQue servicio te interesa? ✨"
-    return "We offer:\n• Laser Hair Removal\n• Facials & Skin Treatments\n• Lash Services\n• Eyebrow Services\n• Permanent Makeup\n• Combo Services\n\nWhich service are you interested in? ✨"
+    return _FALLBACK.get(language, _FALLBACK["en"])
@@ -1,13 +1,35 @@
 from __future__ import annotations
 
-import logging
 from dataclasses import dataclass
 
 from app.application.ports.knowledge_base import KnowledgeBasePort
+from app.application.utils.keyword_matcher import KeywordMatcher
 from app.domain.entities.selection_state import SelectionState
 
+_CATEGORY_KEYWORDS = (
+    ("laser", ("laser", "hair removal", "depilacion", "depilación")),
+    ("brows", ("brow", "eyebrow", "ceja", "cejas")),
+    ("lashes", ("lash", "eyelash", "pestaña", "pestañas")),
+    ("facial", ("facial", "skin", "piel", "exfoliate", "exfoliation", "deep clean", "blackhead")),
+    ("pmu", ("permanent makeup", "pmu", "tattoo", "tatuaje", "microblading")),
+)
 
-@dataclass(frozen=True)
+
+def _category_flags() -> dict[str, int]:
+    flags: dict[str, int] = {}
+    for index, (_, keywords) in enumerate(_CATEGORY_KEYWORDS):
+        for keyword in keywords:
+            flags[keyword] = flags.get(keyword, 0) | (1 << index)
+    return flags
+
+
+_CATEGORY_MATCHER = KeywordMatcher(_category_flags())
+
+# Default for pre_resolved: the message has not been looked up in the KB yet
+_UNRESOLVED = object()
+
+
+@dataclass(frozen=True, slots=True)
 class SelectionResult:
     """Result of selection processing."""
 
@@ -22,17 +44,18 @@ class SelectionUseCase:
 
     def __init__(self, kb: KnowledgeBasePort) -> None:
         self._kb = kb
-        self._logger = logging.getLogger(__name__)
 
     def process_selection_intent(
         self,
         message_text: str,
         current_state: SelectionState,
         language: str,
+        pre_resolved: str | None | object = _UNRESOLVED,
     ) -> SelectionResult:
         """
         Process selection intent from user message.
         Returns updated SelectionState and resolved service if found.
+        Pass pre_resolved when the caller already resolved message_text to a registry key.
         """
         normalized = message_text.lower().strip()
 
@@ -46,7 +69,10 @@ class SelectionUseCase:
             )
 
         # Try to resolve service from message
-        resolved_service = self._kb.resolve_service_to_registry_key(message_text)
+        if pre_resolved is _UNRESOLVED:
+            resolved_service = self._kb.resolve_service_to_registry_key(message_text)
+        else:
+            resolved_service = pre_resolved
 
         if resolved_service:
             # Service found - mark as selected
@@ -108,17 +134,8 @@ class SelectionUseCase:
 
     def _detect_category(self, normalized_text: str) -> str | None:
         """Detect service category from text."""
-        categories = {
-            "laser": ("laser", "hair removal", "depilacion", "depilación"),
-            "brows": ("brow", "eyebrow", "ceja", "cejas"),
-            "lashes": ("lash", "eyelash", "pestaña", "pestañas"),
-            "facial": ("facial", "skin", "piel", "exfoliate", "exfoliation", "deep clean", "blackhead"),
-            "pmu": ("permanent makeup", "pmu", "tattoo", "tatuaje", "microblading"),
-        }
-
-        for category, keywords in categories.items():
-            if any(keyword in normalized_text for keyword in keywords):
-                return category
-
-        return None
-
+        hits = _CATEGORY_MATCHER.scan(normalized_text)
+        if not hits:
+            return None
+        # Lowest set bit is the first category in table order
+        return _CATEGORY_KEYWORDS[(hits & -hits).bit_length() - 1][0]
@@ -1,27 +1,53 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import Any
 
 from app.application.ports.knowledge_base import KnowledgeBasePort
+from app.application.utils.keyword_matcher import KeywordMatcher
 from app.application.utils.message_rules import (
-    asks_about_duration,
-    asks_about_sessions,
-    contains_date_or_time,
-    has_equipment_intent,
-    has_explicit_price_intent,
-    is_booking_request,
-    is_informational_question,
+    FLAG_BOOKING,
+    FLAG_DURATION,
+    FLAG_EQUIPMENT,
+    FLAG_PRICE,
+    FLAG_SESSIONS,
+    classify,
+    normalize_text,
 )
 from app.domain.entities.conversation_state import ConversationState
 
+_FOLLOW_UP_PATTERNS = (
+    "how much",
+    "how long",
+    "how many",
+    "what about",
+    "what is",
+    "what's",
+    "tell me",
+    "cuanto",
+    "cuánto",
+    "cuanto tiempo",
+    "cuantas",
+    "cuántas",
+    "que es",
+    "qué es",
+)
+
+_FOLLOW_UP_MATCHER = KeywordMatcher(dict.fromkeys(_FOLLOW_UP_PATTERNS, 1))
+
+_SPANISH_INDICATORS_RE = re.compile("hola|gracias|precio|cuanto|cuánto|disponibilidad|servicio")
+
+_FOLLOW_UP_PRONOUNS = frozenset({"it", "that", "this", "eso", "esto", "lo", "la"})
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ContextResolution:
     """Resolved context from user message and conversation state."""
 
     resolved_language: str  # "en" or "es"
     resolved_service_key: str | None
+    text_service_key: str | None  # Service resolved from the message text alone
     is_booking_request: bool
     is_duration_question: bool
     is_price_question: bool
@@ -47,9 +73,7 @@ def resolve_context(
 
     # Detect language from message if not set
     if not state.language:
-        normalized = user_text.lower()
-        spanish_indicators = ("hola", "gracias", "precio", "cuanto", "cuánto", "disponibilidad", "servicio")
-        if any(indicator in normalized for indicator in spanish_indicators):
+        if _SPANISH_INDICATORS_RE.search(user_text.lower()):
             resolved_language = "es"
         else:
             resolved_language = "en"
@@ -70,11 +94,12 @@ def resolve_context(
         )
 
     # Detect question types
-    is_booking = is_booking_request(user_text)
-    is_duration = asks_about_duration(user_text)
-    is_price = has_explicit_price_intent(user_text)
-    is_sessions = asks_about_sessions(user_text)
-    is_equipment = has_equipment_intent(user_text)
+    flags = classify(user_text)
+    is_booking = bool(flags & FLAG_BOOKING)
+    is_duration = bool(flags & FLAG_DURATION)
+    is_price = bool(flags & FLAG_PRICE)
+    is_sessions = bool(flags & FLAG_SESSIONS)
+    is_equipment = bool(flags & FLAG_EQUIPMENT)
     is_service = bool(service_from_text) or bool(resolved_service_key)
 
     # Detect follow-up
@@ -83,6 +108,7 @@ def resolve_context(
     return ContextResolution(
         resolved_language=resolved_language,
         resolved_service_key=resolved_service_key,
+        text_service_key=service_from_text,
         is_booking_request=is_booking,
         is_duration_question=is_duration,
         is_price_question=is_price,
@@ -101,26 +127,8 @@ def _detect_follow_up(
     """Detect if this is a follow-up message."""
     normalized = user_text.lower().strip()
 
-    # Common follow-up patterns
-    follow_up_patterns = (
-        "how much",
-        "how long",
-        "how many",
-        "what about",
-        "what is",
-        "what's",
-        "tell me",
-        "cuanto",
-        "cuánto",
-        "cuanto tiempo",
-        "cuantas",
-        "cuántas",
-        "que es",
-        "qué es",
-    )
-
     # Check if message contains follow-up patterns
-    if any(pattern in normalized for pattern in follow_up_patterns):
+    if _FOLLOW_UP_MATCHER.scan(normalized):
         return True
 
     # Check if there's recent conversation context
@@ -130,14 +138,9 @@ def _detect_follow_up(
             (msg for msg in reversed(recent_messages) if msg.get("role") == "assistant"),
             None,
         )
-        if last_assistant_msg:
-            # Check if user is asking about something mentioned in last message
-            last_text = last_assistant_msg.get("text", "").lower()
-            if any(
-                word in normalized
-                for word in ("it", "that", "this", "eso", "esto", "lo", "la")
-            ):
-                return True
+        # Check if user refers back to something mentioned in last message
+        if last_assistant_msg and not _FOLLOW_UP_PRONOUNS.isdisjoint(normalize_text(user_text).split()):
+            return True
 
     # Check if state indicates ongoing conversation
     if state.last_intent or state.last_service or state.booking_state.status != "none":
@@ -4,6 +4,8 @@ import re
 from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
 
+from app.application.utils.keyword_matcher import KeywordMatcher
+
 VAGUE_TIME_RANGES = {
     "morning": (9, 12),
     "afternoon": (12, 17),
@@ -14,6 +16,81 @@ VAGUE_TIME_RANGES = {
     "noche": (17, 20),
 }
 
+_DAY_IN_TEXT = re.compile(r"\b(\d{1,2})\b")
+
+_DATE_PATTERNS = (
+    re.compile(r"\b(\d{1,2})[/-](\d{1,2})[/-]?(\d{2,4})?\b"),
+    re.compile(r"\b(\d{1,2})[/-](\d{1,2})\b"),
+)
+
+_TIME_PATTERNS = (
+    re.compile(r"\b(\d{1,2}):(\d{2})\s*(am|pm)?\b"),
+    re.compile(r"\b(\d{1,2})\s*(am|pm)\b"),
+)
+
+_DAY_NAMES = (
+    ("monday", 0),
+    ("tuesday", 1),
+    ("wednesday", 2),
+    ("thursday", 3),
+    ("friday", 4),
+    ("saturday", 5),
+    ("sunday", 6),
+    ("lunes", 0),
+    ("martes", 1),
+    ("miercoles", 2),
+    ("miércoles", 2),
+    ("jueves", 3),
+    ("viernes", 4),
+    ("sabado", 5),
+    ("sábado", 5),
+    ("domingo", 6),
+)
+
+_MONTH_NAMES = (
+    ("january", 1),
+    ("february", 2),
+    ("march", 3),
+    ("april", 4),
+    ("may", 5),
+    ("june", 6),
+    ("july", 7),
+    ("august", 8),
+    ("september", 9),
+    ("october", 10),
+    ("november", 11),
+    ("december", 12),
+    ("enero", 1),
+    ("febrero", 2),
+    ("marzo", 3),
+    ("abril", 4),
+    ("mayo", 5),
+    ("junio", 6),
+    ("julio", 7),
+    ("agosto", 8),
+    ("septiembre", 9),
+    ("octubre", 10),
+    ("noviembre", 11),
+    ("diciembre", 12),
+)
+
+# Bit layout of a calendar scan: today, tomorrow, then one bit per day name
+# and per month name in table order, so the lowest set bit is the first match.
+_TODAY = 1
+_TOMORROW = 2
+_DAY_BITS = 2
+_MONTH_BITS = _DAY_BITS + len(_DAY_NAMES)
+
+
+def _calendar_keywords() -> dict[str, int]:
+    keywords = {"today": _TODAY, "hoy": _TODAY, "tomorrow": _TOMORROW, "mañana": _TOMORROW}
+    for offset, (name, _) in enumerate(_DAY_NAMES + _MONTH_NAMES):
+        keywords[name] = 1 << (_DAY_BITS + offset)
+    return keywords
+
+
+_CALENDAR_MATCHER = KeywordMatcher(_calendar_keywords())
+
 
 def parse_date_preference(text: str, timezone: ZoneInfo, reference_date: date | None = None) -> date | None:
     """Parse date preference from text. Returns date or None if not found."""
@@ -22,93 +99,42 @@ def parse_date_preference(text: str, timezone: ZoneInfo, reference_date: date |
 
     normalized = text.lower().strip()
 
-    if "today" in normalized or "hoy" in normalized:
+    hits = _CALENDAR_MATCHER.scan(normalized)
+
+    if hits & _TODAY:
         return reference_date
 
-    if "tomorrow" in normalized or "mañana" in normalized:
+    if hits & _TOMORROW:
         return reference_date + timedelta(days=1)
 
-    day_names = {
-        "monday": 0,
-        "tuesday": 1,
-        "wednesday": 2,
-        "thursday": 3,
-        "friday": 4,
-        "saturday": 5,
-        "sunday": 6,
-        "lunes": 0,
-        "martes": 1,
-        "miercoles": 2,
-        "miércoles": 2,
-        "jueves": 3,
-        "viernes": 4,
-        "sabado": 5,
-        "sábado": 5,
-        "domingo": 6,
-    }
-
-    for day_name, day_num in day_names.items():
-        if day_name in normalized:
-            days_ahead = (day_num - reference_date.weekday()) % 7
-            if days_ahead == 0:
-                days_ahead = 7
-            return reference_date + timedelta(days=days_ahead)
-
-    if "next" in normalized:
-        for day_name, day_num in day_names.items():
-            if day_name in normalized:
-                days_ahead = (day_num - reference_date.weekday()) % 7
-                if days_ahead == 0:
-                    days_ahead = 7
-                return reference_date + timedelta(days=days_ahead + 7)
-
-    month_names = {
-        "january": 1,
-        "february": 2,
-        "march": 3,
-        "april": 4,
-        "may": 5,
-        "june": 6,
-        "july": 7,
-        "august": 8,
-        "september": 9,
-        "october": 10,
-        "november": 11,
-        "december": 12,
-        "enero": 1,
-        "febrero": 2,
-        "marzo": 3,
-        "abril": 4,
-        "mayo": 5,
-        "junio": 6,
-        "julio": 7,
-        "agosto": 8,
-        "septiembre": 9,
-        "octubre": 10,
-        "noviembre": 11,
-        "diciembre": 12,
-    }
-
-    for month_name, month_num in month_names.items():
-        if month_name in normalized:
-            day_match = re.search(r"\b(\d{1,2})\b", normalized)
-            if day_match:
-                day = int(day_match.group(1))
-                year = reference_date.year
-                if month_num < reference_date.month or (month_num == reference_date.month and day < reference_date.day):
-                    year += 1
-                try:
-                    return date(year, month_num, day)
-                except ValueError:
-                    pass
-
-    date_patterns = [
-        r"\b(\d{1,2})[/-](\d{1,2})[/-]?(\d{2,4})?\b",
-        r"\b(\d{1,2})[/-](\d{1,2})\b",
-    ]
-
-    for pattern in date_patterns:
-        match = re.search(pattern, normalized)
+    day_hits = (hits >> _DAY_BITS) & ((1 << len(_DAY_NAMES)) - 1)
+    if day_hits:
+        day_num = _DAY_NAMES[_lowest_bit(day_hits)][1]
+        days_ahead = (day_num - reference_date.weekday()) % 7
+        if days_ahead == 0:
+            days_ahead = 7
+        # "next friday" means the one after the upcoming friday
+        if "next" in normalized.split():
+            days_ahead += 7
+        return reference_date + timedelta(days=days_ahead)
+
+    month_hits = hits >> _MONTH_BITS
+    day_match = _DAY_IN_TEXT.search(normalized) if month_hits else None
+    if day_match:
+        day = int(day_match.group(1))
+        for index, (_, month_num) in enumerate(_MONTH_NAMES):
+            if not month_hits >> index & 1:
+                continue
+            year = reference_date.year
+            if month_num < reference_date.month or (month_num == reference_date.month and day < reference_date.day):
+                year += 1
+            try:
+                return date(year, month_num, day)
+            except ValueError:
+                pass
+
+    for pattern in _DATE_PATTERNS:
+        match = pattern.search(normalized)
         if match:
             month = int(match.group(1))
             day = int(match.group(2))
@@ -129,13 +155,8 @@ def parse_time_preference(text: str) -> tuple[int, int] | None:
     """Parse time preference from text. Returns (hour, minute) or None."""
     normalized = text.lower().strip()
 
-    time_patterns = [
-        r"\b(\d{1,2}):(\d{2})\s*(am|pm)?\b",
-        r"\b(\d{1,2})\s*(am|pm)\b",
-    ]
-
-    for pattern in time_patterns:
-        match = re.search(pattern, normalized)
+    for pattern in _TIME_PATTERNS:
+        match = pattern.search(normalized)
         if match:
             hour = int(match.group(1))
             minute = int(match.group(2)) if match.lastindex >= 2 and match.group(2).isdigit() else 0
@@ -152,6 +173,10 @@ def parse_time_preference(text: str) -> tuple[int, int] | None:
     return None
 
 
+def _lowest_bit(mask: int) -> int:
+    return (mask & -mask).bit_length() - 1
+
+
 def map_vague_time_to_range(vague_time: str) -> tuple[int, int] | None:
     """Map vague time description to hour range. Returns (start_hour, end_hour) or None."""
     normalized = vague_time.lower().strip()
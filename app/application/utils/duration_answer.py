@@ -2,6 +2,17 @@ from __future__ import annotations
 
 from app.application.ports.service_catalog import ServiceCatalogPort
 
+# language -> (duration verb, price lead-in)
+_PHRASES = {
+    "en": ("takes about", "The price is"),
+    "es": ("toma aproximadamente", "El precio es"),
+}
+
+_NO_INFORMATION = {
+    "en": "I don't have information about the duration of this service.",
+    "es": "No tengo información sobre la duración de este servicio.",
+}
+
 
 def build_duration_response(
     service_key: str,
@@ -12,30 +23,20 @@ def build_duration_response(
     """Build duration response using service catalog."""
     entry = catalog.get_service(service_key)
     if not entry:
-        if language == "es":
-            return "No tengo información sobre la duración de este servicio."
-        return "I don't have information about the duration of this service."
+        return _NO_INFORMATION.get(language, _NO_INFORMATION["en"])
 
-    duration_text = ""
     if entry.duration_minutes_max and entry.duration_minutes_max != entry.duration_minutes_min:
         duration_text = f"{entry.duration_minutes_min}–{entry.duration_minutes_max} minutes"
     else:
         duration_text = f"{entry.duration_minutes_min} minutes"
 
-    service_name = entry.display_name
+    takes, price_lead = _PHRASES.get(language, _PHRASES["en"])
 
     if include_price:
-        price_text = ""
         if entry.price_max and entry.price_max != entry.price_min:
             price_text = f"${entry.price_min}–${entry.price_max}"
         else:
             price_text = f"${entry.price_min}"
+        return f"{entry.display_name} {takes} {duration_text}. {price_lead} {price_text}."
 
-        if language == "es":
-            return f"{service_name} toma aproximadamente {duration_text}. El precio es {price_text}."
-        return f"{service_name} takes about {duration_text}. The price is {price_text}."
-
-    if language == "es":
-        return f"{service_name} toma aproximadamente {duration_text}."
-    return f"{service_name} takes about {duration_text}."
-
+    return f"{entry.display_name} {takes} {duration_text}."
@@ -1,5 +1,16 @@
 from __future__ import annotations
 
+_ACKNOWLEDGEMENTS = frozenset({
+    "thanks",
+    "thank you",
+    "ok",
+    "okay",
+    "yes",
+    "yep",
+    "👍",
+    "🙏",
+})
+
 
 def build_greeting(language: str) -> str:
     return "Hello, thank you for reaching out!"
@@ -7,14 +18,4 @@ def build_greeting(language: str) -> str:
 
 def is_follow_up(text: str) -> bool:
     normalized = " ".join(text.lower().split())
-    ack_set = {
-        "thanks",
-        "thank you",
-        "ok",
-        "okay",
-        "yes",
-        "yep",
-        "👍",
-        "🙏",
-    }
-    return normalized in ack_set
+    return normalized in _ACKNOWLEDGEMENTS
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Mapping
+
+
+class KeywordMatcher:
+    """
+    Multi-keyword substring matcher built once from a keyword -> flags mapping.
+    Keywords are folded into a single trie-shaped regex so a message is scanned
+    in one pass instead of one `in` check per keyword.
+    """
+
+    def __init__(self, keywords: Mapping[str, int]) -> None:
+        self._flags = _prefix_closed_flags(keywords)
+        self._pattern = re.compile("(?=(" + _trie_pattern(keywords) + "))") if keywords else None
+
+    def scan(self, text: str) -> int:
+        """Return the OR of the flags of every keyword that occurs in text."""
+        if self._pattern is None:
+            return 0
+        flags = self._flags
+        mask = 0
+        for match in self._pattern.finditer(text):
+            mask |= flags[match.group(1)]
+        return mask
+
+
+def _prefix_closed_flags(keywords: Mapping[str, int]) -> dict[str, int]:
+    # Only the longest keyword at a position is captured, so fold in the flags
+    # of every shorter keyword that is a prefix of it.
+    closed: dict[str, int] = {}
+    for keyword in keywords:
+        mask = 0
+        for other, flags in keywords.items():
+            if keyword.startswith(other):
+                mask |= flags
+        closed[keyword] = mask
+    return closed
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    trie: dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+    return _emit(trie)
+
+
+def _emit(node: dict[str, dict]) -> str:
+    branches = [re.escape(ch) + _emit(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+    if len(branches) == 1:
+        body = branches[0]
+        return f"(?:{body})?" if "" in node else body
+    body = "(?:" + "|".join(branches) + ")"
+    return body + "?" if "" in node else body
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
+
+from app.application.utils.keyword_matcher import KeywordMatcher
 
 YES_NO_PATTERNS = (
     "is there",
@@ -17,23 +20,266 @@ SERVICE_EXISTENCE_PATTERNS = (
     "do you provide",
 )
 
+_SERVICE_EXISTENCE_RE = re.compile("|".join(map(re.escape, SERVICE_EXISTENCE_PATTERNS)))
+_LOCATION_RE = re.compile("location|address|where|located")
+
+_GREETINGS = frozenset({"hi", "hello", "hey", "hola"})
+
+FLAG_BOOKING = 1
+FLAG_PRICE = 2
+FLAG_EQUIPMENT = 4
+FLAG_SESSIONS = 8
+FLAG_DURATION = 16
+FLAG_INFORMATIONAL = 32
+FLAG_RESULTS = 64
+FLAG_DATE = 128
+FLAG_TIME = 256
+
+_BOOKING_VERBS = (
+    "book",
+    "schedule",
+    "appointment",
+    "reserve",
+    "reservar",
+    "agendar",
+    "cita",
+)
+
+_BOOKING_PATTERNS = (
+    "i would like to book",
+    "i want to book",
+    "i would like to schedule",
+    "i want to schedule",
+    "ready to book",
+    "i want to make an appointment",
+    "i would like to make an appointment",
+    "can i schedule",
+    "can i book",
+    "would like to schedule",
+    "want to schedule",
+    "make an appointment",
+    "set up an appointment",
+)
+
+_PRICE_KEYWORDS = (
+    "price",
+    "pricing",
+    "cost",
+    "how much",
+    "how many",
+    "cuanto",
+    "precio",
+    "costo",
+    "cuánto",
+    "$",
+    "dollar",
+    "dollars",
+)
+
+_EQUIPMENT_KEYWORDS = (
+    "machine",
+    "equipment",
+    "laser machine",
+    "what laser",
+    "which laser",
+    "maquina",
+    "equipo",
+)
+
+_SESSION_KEYWORDS = (
+    "how many times",
+    "how many sessions",
+    "how often",
+    "how long does it take",
+    "how many do i need",
+    "how many visits",
+    "cuantas veces",
+    "cuantas sesiones",
+    "cuanto tiempo",
+)
+
+_DURATION_KEYWORDS = (
+    "how long does it take",
+    "how long is",
+    "what is the duration",
+    "how much time",
+    "how long should i expect",
+    "how long is the appointment",
+    "cuanto tiempo toma",
+    "cuanto dura",
+    "duracion",
+    "duración",
+)
+
+_INFORMATIONAL_PATTERNS = (
+    "will i see",
+    "will i get",
+    "will i have",
+    "what will",
+    "what should i expect",
+    "what to expect",
+    "when will i see",
+    "when will i get",
+    "how long until",
+    "how long before",
+    "when do i see",
+    "when do i get",
+    "results after",
+    "results from",
+    "outcome",
+    "effectiveness",
+    "how effective",
+    "what happens",
+    "what to expect",
+    "que esperar",
+    "cuando vere",
+    "cuando tendre",
+    "resultados",
+)
+
+_RESULTS_PATTERNS = (
+    "see results",
+    "get results",
+    "have results",
+    "results after",
+    "results from",
+    "results with",
+    "when will i see",
+    "when do i see",
+    "when will i get",
+    "when do i get",
+    "after first session",
+    "after one session",
+    "after 1 session",
+    "how many sessions until",
+    "sessions until",
+    "does it work after",
+    "work after one",
+    "work after 1",
+    "effective after",
+    "resultados",
+    "cuando vere resultados",
+    "cuando tendre resultados",
+    "despues de la primera sesion",
+)
+
+_DATE_KEYWORDS = (
+    "today",
+    "tomorrow",
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+    "next week",
+    "next month",
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+    "hoy",
+    "mañana",
+    "lunes",
+    "martes",
+    "miercoles",
+    "miércoles",
+    "jueves",
+    "viernes",
+    "sabado",
+    "sábado",
+    "domingo",
+)
+
+_TIME_KEYWORDS = (
+    "am",
+    "pm",
+    "morning",
+    "afternoon",
+    "evening",
+    "night",
+    "mañana",
+    "tarde",
+    "noche",
+)
+
+
+def _keyword_flags() -> dict[str, int]:
+    groups = (
+        (_BOOKING_VERBS, FLAG_BOOKING),
+        (_BOOKING_PATTERNS, FLAG_BOOKING),
+        (_PRICE_KEYWORDS, FLAG_PRICE),
+        (_EQUIPMENT_KEYWORDS, FLAG_EQUIPMENT),
+        (_SESSION_KEYWORDS, FLAG_SESSIONS),
+        (_DURATION_KEYWORDS, FLAG_DURATION),
+        (_INFORMATIONAL_PATTERNS, FLAG_INFORMATIONAL),
+        (_RESULTS_PATTERNS, FLAG_RESULTS),
+        (_DATE_KEYWORDS, FLAG_DATE),
+        (_TIME_KEYWORDS, FLAG_TIME),
+    )
+    keyword_flags: dict[str, int] = {}
+    for keywords, flag in groups:
+        for keyword in keywords:
+            keyword_flags[keyword] = keyword_flags.get(keyword, 0) | flag
+    return keyword_flags
+
+
+_MATCHER = KeywordMatcher(_keyword_flags())
+
+_NON_ALNUM = re.compile(r"[^a-z0-9\s]")
+_WHITESPACE = re.compile(r"\s+")
+_TIME_RE = re.compile(r"\d{1,2}\s*(am|pm|:\d{2})")
+
+# ASCII fast path for normalize_text: every character other than a-z, 0-9
+# and whitespace becomes a space, matching the _NON_ALNUM substitution.
+_ASCII_TO_ALNUM = {
+    code: " "
+    for code in range(128)
+    if not (chr(code).isspace() or "a" <= chr(code) <= "z" or "0" <= chr(code) <= "9")
+}
 
+
+@lru_cache(maxsize=4096)
 def normalize_text(text: str) -> str:
-    normalized = text.lower().replace("+", " ")
-    normalized = re.sub(r"[^a-z0-9\s]", " ", normalized)
-    normalized = re.sub(r"\s+", " ", normalized).strip()
+    normalized = text.lower()
+    if normalized.isascii():
+        return " ".join(normalized.translate(_ASCII_TO_ALNUM).split())
+    normalized = normalized.replace("+", " ")
+    normalized = _NON_ALNUM.sub(" ", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
     return normalized
 
 
+@lru_cache(maxsize=4096)
+def classify(text: str) -> int:
+    """
+    Scan the normalized message once and return a bitmask of FLAG_* values,
+    one per keyword group mentioned in the text.
+    """
+    normalized = normalize_text(text)
+    mask = _MATCHER.scan(normalized)
+    if not mask & FLAG_TIME and _TIME_RE.search(normalized):
+        mask |= FLAG_TIME
+    return mask
+
+
 def is_yes_no_question(text: str) -> bool:
     normalized = normalize_text(text)
     normalized = _strip_greeting(normalized)
-    return any(normalized.startswith(pattern) for pattern in YES_NO_PATTERNS)
+    return normalized.startswith(YES_NO_PATTERNS)
 
 
 def is_service_existence_question(text: str) -> bool:
-    normalized = normalize_text(text)
-    return any(pattern in normalized for pattern in SERVICE_EXISTENCE_PATTERNS)
+    return _SERVICE_EXISTENCE_RE.search(normalize_text(text)) is not None
 
 
 def extract_service_query(text: str) -> str | None:
@@ -50,8 +296,7 @@ def is_brazilian_query(text: str) -> bool:
 
 
 def contains_location_request(text: str) -> bool:
-    normalized = normalize_text(text)
-    return any(term in normalized for term in ("location", "address", "where", "located"))
+    return _LOCATION_RE.search(normalize_text(text)) is not None
 
 
 def is_booking_request(text: str) -> bool:
@@ -59,45 +304,15 @@ def is_booking_request(text: str) -> bool:
     Check if user explicitly requests to book or schedule.
     Requires schedule verbs or appointment keywords, not just "session".
     """
-    normalized = normalize_text(text)
-    booking_verbs = (
-        "book",
-        "schedule",
-        "appointment",
-        "reserve",
-        "reservar",
-        "agendar",
-        "cita",
-    )
-    
-    booking_patterns = (
-        "i would like to book",
-        "i want to book",
-        "i would like to schedule",
-        "i want to schedule",
-        "ready to book",
-        "i want to make an appointment",
-        "i would like to make an appointment",
-        "can i schedule",
-        "can i book",
-        "would like to schedule",
-        "want to schedule",
-        "make an appointment",
-        "set up an appointment",
-    )
-    
-    has_booking_verb = any(verb in normalized for verb in booking_verbs)
-    has_booking_pattern = any(pat in normalized for pat in booking_patterns)
-    
-    return has_booking_verb or has_booking_pattern
+    return bool(classify(text) & FLAG_BOOKING)
 
 
 def _strip_greeting(text: str) -> str:
-    greetings = ("hi", "hello", "hey", "hola")
     parts = text.split()
-    while parts and parts[0] in greetings:
-        parts = parts[1:]
-    return " ".join(parts)
+    start = 0
+    while start < len(parts) and parts[start] in _GREETINGS:
+        start += 1
+    return " ".join(parts[start:])
 
 
 def has_explicit_price_intent(text: str) -> bool:
@@ -105,78 +320,28 @@ def has_explicit_price_intent(text: str) -> bool:
     Check if user explicitly asks about price, cost, or "how much".
     Pricing blocks should ONLY be included if this returns True.
     """
-    normalized = normalize_text(text)
-    price_keywords = (
-        "price",
-        "pricing",
-        "cost",
-        "how much",
-        "how many",
-        "cuanto",
-        "precio",
-        "costo",
-        "cuánto",
-        "$",
-        "dollar",
-        "dollars",
-    )
-    return any(keyword in normalized for keyword in price_keywords)
+    return bool(classify(text) & FLAG_PRICE)
 
 
 def has_equipment_intent(text: str) -> bool:
     """
     Check if user asks about equipment/machine.
     """
-    normalized = normalize_text(text)
-    equipment_keywords = (
-        "machine",
-        "equipment",
-        "laser machine",
-        "what laser",
-        "which laser",
-        "maquina",
-        "equipo",
-    )
-    return any(keyword in normalized for keyword in equipment_keywords)
+    return bool(classify(text) & FLAG_EQUIPMENT)
 
 
 def asks_about_sessions(text: str) -> bool:
     """
     Check if user asks about number of sessions, frequency, or duration.
     """
-    normalized = normalize_text(text)
-    session_keywords = (
-        "how many times",
-        "how many sessions",
-        "how often",
-        "how long does it take",
-        "how many do i need",
-        "how many visits",
-        "cuantas veces",
-        "cuantas sesiones",
-        "cuanto tiempo",
-    )
-    return any(keyword in normalized for keyword in session_keywords)
+    return bool(classify(text) & FLAG_SESSIONS)
 
 
 def asks_about_duration(text: str) -> bool:
     """
     Check if user asks about appointment duration or how long a service takes.
     """
-    normalized = normalize_text(text)
-    duration_keywords = (
-        "how long does it take",
-        "how long is",
-        "what is the duration",
-        "how much time",
-        "how long should i expect",
-        "how long is the appointment",
-        "cuanto tiempo toma",
-        "cuanto dura",
-        "duracion",
-        "duración",
-    )
-    return any(keyword in normalized for keyword in duration_keywords)
+    return bool(classify(text) & FLAG_DURATION)
 
 
 def is_informational_question(text: str) -> bool:
@@ -184,33 +349,7 @@ def is_informational_question(text: str) -> bool:
     Check if user is asking an informational question that should NOT trigger booking flow.
     These are questions about results, outcomes, what to expect, etc.
     """
-    normalized = normalize_text(text)
-    informational_patterns = (
-        "will i see",
-        "will i get",
-        "will i have",
-        "what will",
-        "what should i expect",
-        "what to expect",
-        "when will i see",
-        "when will i get",
-        "how long until",
-        "how long before",
-        "when do i see",
-        "when do i get",
-        "results after",
-        "results from",
-        "outcome",
-        "effectiveness",
-        "how effective",
-        "what happens",
-        "what to expect",
-        "que esperar",
-        "cuando vere",
-        "cuando tendre",
-        "resultados",
-    )
-    return any(pattern in normalized for pattern in informational_patterns)
+    return bool(classify(text) & FLAG_INFORMATIONAL)
 
 
 def asks_about_results(text: str) -> bool:
@@ -218,33 +357,7 @@ def asks_about_results(text: str) -> bool:
     Check if user asks about results, outcomes, or effectiveness.
     This is a more specific version of informational questions focused on results.
     """
-    normalized = normalize_text(text)
-    results_patterns = (
-        "see results",
-        "get results",
-        "have results",
-        "results after",
-        "results from",
-        "results with",
-        "when will i see",
-        "when do i see",
-        "when will i get",
-        "when do i get",
-        "after first session",
-        "after one session",
-        "after 1 session",
-        "how many sessions until",
-        "sessions until",
-        "does it work after",
-        "work after one",
-        "work after 1",
-        "effective after",
-        "resultados",
-        "cuando vere resultados",
-        "cuando tendre resultados",
-        "despues de la primera sesion",
-    )
-    return any(pattern in normalized for pattern in results_patterns)
+    return bool(classify(text) & FLAG_RESULTS)
 
 
 def contains_date_or_time(text: str) -> bool:
@@ -252,60 +365,4 @@ def contains_date_or_time(text: str) -> bool:
     Check if message contains date or time information that could be a booking response.
     Used to detect if user is replying to a booking question with date/time.
     """
-    normalized = normalize_text(text)
-    
-    date_keywords = (
-        "today",
-        "tomorrow",
-        "monday",
-        "tuesday",
-        "wednesday",
-        "thursday",
-        "friday",
-        "saturday",
-        "sunday",
-        "next week",
-        "next month",
-        "january",
-        "february",
-        "march",
-        "april",
-        "may",
-        "june",
-        "july",
-        "august",
-        "september",
-        "october",
-        "november",
-        "december",
-        "hoy",
-        "mañana",
-        "lunes",
-        "martes",
-        "miercoles",
-        "miércoles",
-        "jueves",
-        "viernes",
-        "sabado",
-        "sábado",
-        "domingo",
-    )
-    
-    time_keywords = (
-        "am",
-        "pm",
-        "morning",
-        "afternoon",
-        "evening",
-        "night",
-        "mañana",
-        "tarde",
-        "noche",
-    )
-    
-    time_pattern = re.search(r"\d{1,2}\s*(am|pm|:\d{2})", normalized)
-    
-    has_date = any(keyword in normalized for keyword in date_keywords)
-    has_time = any(keyword in normalized for keyword in time_keywords) or time_pattern is not None
-    
-    return has_date or has_time
+    return bool(classify(text) & (FLAG_DATE | FLAG_TIME))
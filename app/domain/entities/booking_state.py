@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BookingState:
     status: str = "none"  # "none", "collecting_service", "collecting_date", "collecting_time", "confirming", "confirmed"
     proposed_date: datetime | None = None
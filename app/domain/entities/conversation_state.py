@@ -4,7 +4,7 @@ from app.domain.entities.booking_state import BookingState
 from app.domain.entities.selection_state import SelectionState
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConversationState:
     last_intent: str | None = None
     awaiting_booking: bool = False  # deprecated, use booking_state.status
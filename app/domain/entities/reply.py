@@ -1,10 +1,14 @@
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping
 
+# Read-only, so every reply without meta can share it
+_EMPTY_META: Mapping[str, Any] = MappingProxyType({})
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Reply:
     text: str
     should_handoff: bool
     handoff_reason: str
-    meta: dict[str, Any]
+    meta: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_META)
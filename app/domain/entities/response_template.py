@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResponseTemplate:
     text: str
-    required_substrings: list[str]
+    required_substrings: tuple[str, ...]
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SelectionState:
     status: str = "none"  # "none", "awaiting_service_choice", "service_selected"
     pending_category: str | None = None  # e.g., "laser", "brows", "facial", "lashes", "pmu"
@@ -2,11 +2,16 @@ from __future__ import annotations
 
 import logging
 from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
 
 import httpx
+import orjson
 
 from app.application.ports.calendar import CalendarPort
 from app.core.config import settings
+from app.infrastructure.http.shared import get_http_client
+
+_MAX_SLOTS = 10
 
 
 class CalComCalendar(CalendarPort):
@@ -15,16 +20,26 @@ class CalComCalendar(CalendarPort):
         api_key: str | None = None,
         calendar_id: str | None = None,
         base_url: str | None = None,
+        client: httpx.Client | None = None,
+        timezone: ZoneInfo | None = None,
     ) -> None:
         self._api_key = api_key or settings.CAL_COM_API_KEY
         self._calendar_id = calendar_id or settings.CAL_COM_CALENDAR_ID
         self._base_url = base_url or settings.CAL_COM_BASE_URL
-        self._client = httpx.Client(timeout=10.0)
+        self._client = client or get_http_client()
+        # Hour windows are business-local; Cal.com returns UTC timestamps
+        self._timezone = timezone or ZoneInfo(settings.BUSINESS_TIMEZONE)
         self._logger = logging.getLogger(__name__)
 
         if not self._api_key:
             raise ValueError("CAL_COM_API_KEY is required for Cal.com calendar")
 
+        # Endpoints and auth never change per instance, so build them once
+        self._slots_url = f"{self._base_url}/slots"
+        self._bookings_url = f"{self._base_url}/bookings"
+        self._auth_headers = {"Authorization": f"Bearer {self._api_key}"}
+        self._json_headers = {**self._auth_headers, "Content-Type": "application/json"}
+
     def check_availability(self, start: datetime, end: datetime) -> bool:
         try:
             slots = self.find_available_slots(start.date(), int((end - start).total_seconds() / 60))
@@ -43,35 +58,61 @@ class CalComCalendar(CalendarPort):
         start_hour: int = 9,
         end_hour: int = 17,
     ) -> list[datetime]:
-        try:
-            start_datetime = datetime.combine(date, datetime.min.time().replace(hour=start_hour))
-            end_datetime = datetime.combine(date, datetime.min.time().replace(hour=end_hour))
-
-            url = f"{self._base_url}/slots"
-            params = {
-                "calendarId": self._calendar_id,
-                "startTime": start_datetime.isoformat(),
-                "endTime": end_datetime.isoformat(),
-                "duration": duration_minutes,
-            }
-            headers = {"Authorization": f"Bearer {self._api_key}"}
+        return self.find_available_slots_batch([date], duration_minutes, start_hour, end_hour)[date]
 
-            response = self._client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-
-            data = response.json()
-            slots: list[datetime] = []
-            for slot_str in data.get("slots", []):
-                try:
-                    slot = datetime.fromisoformat(slot_str.replace("Z", "+00:00"))
-                    slots.append(slot)
-                except (ValueError, AttributeError):
-                    continue
-
-            return slots[:10]
+    def find_available_slots_batch(
+        self,
+        dates: list[date],
+        duration_minutes: int,
+        start_hour: int = 9,
+        end_hour: int = 17,
+    ) -> dict[date, list[datetime]]:
+        """Fetch slots for all dates with one range query and bucket them by day."""
+        buckets: dict[date, list[datetime]] = {day: [] for day in dates}
+        if not buckets:
+            return buckets
+        try:
+            first, last = min(buckets), max(buckets)
+            # Anchor the query window to the same business-local clock as the filter below
+            start_datetime = datetime(first.year, first.month, first.day, start_hour, tzinfo=self._timezone)
+            end_datetime = datetime(last.year, last.month, last.day, end_hour, tzinfo=self._timezone)
+            for slot in self._fetch_slots(start_datetime, end_datetime, duration_minutes):
+                # Filter and bucket on the business-local clock, but return the slot as received
+                local = slot.astimezone(self._timezone) if slot.tzinfo else slot
+                day_slots = buckets.get(local.date())
+                if day_slots is not None and start_hour <= local.hour < end_hour and len(day_slots) < _MAX_SLOTS:
+                    day_slots.append(slot)
         except Exception as e:
             self._logger.error("Error finding available slots", extra={"error": str(e)})
-            return []
+        return buckets
+
+    def _fetch_slots(
+        self,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        duration_minutes: int,
+    ) -> list[datetime]:
+        params = {
+            "calendarId": self._calendar_id,
+            "startTime": start_datetime.isoformat(),
+            "endTime": end_datetime.isoformat(),
+            "duration": duration_minutes,
+        }
+
+        response = self._client.get(self._slots_url, params=params, headers=self._auth_headers)
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+        slots: list[datetime] = []
+        for slot_str in data.get("slots", []):
+            if not isinstance(slot_str, str):
+                continue
+            try:
+                # fromisoformat accepts Cal.com's trailing "Z" natively on 3.11+
+                slots.append(datetime.fromisoformat(slot_str))
+            except ValueError:
+                continue
+        return slots
 
     def create_event(
         self,
@@ -82,8 +123,6 @@ class CalComCalendar(CalendarPort):
         attendee_email: str | None = None,
     ) -> str:
         try:
-            url = f"{self._base_url}/bookings"
-            headers = {"Authorization": f"Bearer {self._api_key}", "Content-Type": "application/json"}
             payload = {
                 "eventTypeId": self._calendar_id,
                 "startTime": start.isoformat(),
@@ -94,10 +133,14 @@ class CalComCalendar(CalendarPort):
             if attendee_email:
                 payload["attendeeEmail"] = attendee_email
 
-            response = self._client.post(url, json=payload, headers=headers)
+            response = self._client.post(
+                self._bookings_url,
+                content=orjson.dumps(payload),
+                headers=self._json_headers,
+            )
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             event_id = data.get("id") or data.get("bookingId")
             if not event_id:
                 raise ValueError("No event ID returned from Cal.com API")
@@ -110,10 +153,7 @@ class CalComCalendar(CalendarPort):
 
     def cancel_event(self, event_id: str) -> bool:
         try:
-            url = f"{self._base_url}/bookings/{event_id}"
-            headers = {"Authorization": f"Bearer {self._api_key}"}
-
-            response = self._client.delete(url, headers=headers)
+            response = self._client.delete(f"{self._bookings_url}/{event_id}", headers=self._auth_headers)
             response.raise_for_status()
 
             self._logger.info("Calendar event cancelled", extra={"event_id": event_id})
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from bisect import bisect_left
 from datetime import date, datetime, timedelta
 
 from app.application.ports.calendar import CalendarPort
@@ -9,13 +10,15 @@ from app.application.ports.calendar import CalendarPort
 class MockCalendar(CalendarPort):
     def __init__(self) -> None:
         self._events: dict[str, tuple[datetime, datetime]] = {}
+        # Busy intervals sorted by start, with the running max of their ends
+        self._busy_starts: list[datetime] = []
+        self._max_ends: list[datetime] = []
         self._logger = logging.getLogger(__name__)
 
     def check_availability(self, start: datetime, end: datetime) -> bool:
-        for event_start, event_end in self._events.values():
-            if not (end <= event_start or start >= event_end):
-                return False
-        return True
+        # Only events starting before `end` can overlap; one of them does if any ends after `start`
+        index = bisect_left(self._busy_starts, end)
+        return index == 0 or self._max_ends[index - 1] <= start
 
     def find_available_slots(
         self,
@@ -25,16 +28,23 @@ class MockCalendar(CalendarPort):
         end_hour: int = 17,
     ) -> list[datetime]:
         slots: list[datetime] = []
-        current = datetime.combine(date, datetime.min.time().replace(hour=start_hour))
-        end_time = datetime.combine(date, datetime.min.time().replace(hour=end_hour))
+        current = datetime(date.year, date.month, date.day, start_hour)
+        end_time = datetime(date.year, date.month, date.day, end_hour)
+        duration = timedelta(minutes=duration_minutes)
+        step = timedelta(minutes=30)
 
-        while current + timedelta(minutes=duration_minutes) <= end_time:
-            slot_end = current + timedelta(minutes=duration_minutes)
-            if self.check_availability(current, slot_end):
+        # Candidate ends only move forward, so one pointer sweeps the busy list
+        index = 0
+        count = len(self._busy_starts)
+        while current + duration <= end_time and len(slots) < 10:
+            slot_end = current + duration
+            while index < count and self._busy_starts[index] < slot_end:
+                index += 1
+            if index == 0 or self._max_ends[index - 1] <= current:
                 slots.append(current)
-            current += timedelta(minutes=30)
+            current += step
 
-        return slots[:10]
+        return slots
 
     def create_event(
         self,
@@ -46,6 +56,7 @@ class MockCalendar(CalendarPort):
     ) -> str:
         event_id = f"mock_event_{len(self._events) + 1}"
         self._events[event_id] = (start, end)
+        self._reindex()
         self._logger.info(
             "Mock calendar event created",
             extra={
@@ -60,7 +71,14 @@ class MockCalendar(CalendarPort):
     def cancel_event(self, event_id: str) -> bool:
         if event_id in self._events:
             del self._events[event_id]
+            self._reindex()
             self._logger.info("Mock calendar event cancelled", extra={"event_id": event_id})
             return True
         return False
 
+    def _reindex(self) -> None:
+        busy = sorted(self._events.values())
+        self._busy_starts = [start for start, _ in busy]
+        self._max_ends = []
+        for _, end in busy:
+            self._max_ends.append(max(end, self._max_ends[-1]) if self._max_ends else end)
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+import httpx
+
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30)
+_TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+# Retries only cover failed connection attempts, so they are safe for POST/DELETE too
+_CONNECT_RETRIES = 2
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """Process-wide pooled client so outbound calls reuse keep-alive connections."""
+    transport = httpx.HTTPTransport(retries=_CONNECT_RETRIES, limits=_LIMITS)
+    return httpx.Client(transport=transport, timeout=_TIMEOUT)
@@ -3,13 +3,23 @@ from __future__ import annotations
 import logging
 
 import httpx
+import orjson
+
+from app.infrastructure.http.shared import get_http_client
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 class InstagramClient:
-    def __init__(self, access_token: str, send_endpoint: str) -> None:
+    def __init__(
+        self,
+        access_token: str,
+        send_endpoint: str,
+        client: httpx.Client | None = None,
+    ) -> None:
         self._access_token = access_token
         self._send_endpoint = send_endpoint
-        self._client = httpx.Client(timeout=10.0)
+        self._client = client or get_http_client()
         self._logger = logging.getLogger(__name__)
 
     def send_text(self, recipient_id: str, text: str) -> None:
@@ -18,11 +28,16 @@ class InstagramClient:
             "message": {"text": text},
         }
         params = {"access_token": self._access_token}
-        resp = self._client.post(self._send_endpoint, params=params, json=payload)
+        resp = self._client.post(
+            self._send_endpoint,
+            params=params,
+            content=orjson.dumps(payload),
+            headers=_JSON_HEADERS,
+        )
         if resp.status_code >= 400:
             error_body = resp.text
             try:
-                error_json = resp.json()
+                error_json = orjson.loads(resp.content)
                 error_code = error_json.get("error", {}).get("code")
                 error_message = error_json.get("error", {}).get("message")
                 error_subcode = error_json.get("error", {}).get("error_subcode")
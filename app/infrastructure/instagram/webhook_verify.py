@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import hashlib
 import hmac
 import logging
+from functools import lru_cache
 from typing import Mapping
 
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4)
+def _hmac_template(app_secret: str) -> hmac.HMAC:
+    """Keyed HMAC with the pads already absorbed; callers must .copy() it."""
+    return hmac.new(app_secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+
 def verify_get_request(params: Mapping[str, str], expected_token: str) -> str | None:
     mode = params.get("hub.mode")
     token = params.get("hub.verify_token")
@@ -36,5 +44,11 @@ def verify_post_signature(body: bytes, signature_header: str | None, app_secret:
     if algo.lower() != "sha256":
         return False
 
-    expected = hmac.new(app_secret.encode("utf-8"), body, "sha256").hexdigest()
-    return hmac.compare_digest(expected, signature)
+    try:
+        received = bytes.fromhex(signature)
+    except ValueError:
+        return False
+
+    mac = _hmac_template(app_secret).copy()
+    mac.update(body)
+    return hmac.compare_digest(mac.digest(), received)
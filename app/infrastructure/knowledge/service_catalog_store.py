@@ -10,8 +10,11 @@ class ServiceCatalogStore(ServiceCatalogPort):
         self._catalog = catalog or SERVICE_CATALOG
 
     def get_service(self, service_key: str) -> ServiceCatalogEntry | None:
-        normalized_key = service_key.lower().strip()
-        return self._catalog.get(normalized_key)
+        # Callers usually pass canonical registry keys, so try those before normalizing
+        entry = self._catalog.get(service_key)
+        if entry is None:
+            entry = self._catalog.get(service_key.lower().strip())
+        return entry
 
     def get_duration_minutes(self, service_key: str) -> int:
         entry = self.get_service(service_key)
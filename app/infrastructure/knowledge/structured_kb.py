@@ -1,12 +1,85 @@
 from __future__ import annotations
 
-import re
+from collections.abc import Iterable
 from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Any
 
 from app.application.ports.knowledge_base import KnowledgeBasePort
+from app.application.utils.keyword_matcher import KeywordMatcher
+from app.application.utils.message_rules import normalize_text
 from app.domain.entities.response_template import ResponseTemplate
 from app.infrastructure.knowledge.service_registry import SERVICE_REGISTRY
 
+_LANGUAGES = ("en", "es")
+_MISSING = object()
+
+# Semantic alias buckets for common user wording, checked in order before registry aliases
+_SEMANTIC_BUCKETS = (
+    (
+        "facial_deep_blackhead_removal",
+        (
+            "deep clean",
+            "deep cleaning",
+            "deep cleanse",
+            "exfoliate",
+            "exfoliation",
+            "exfoliating",
+            "clean pores",
+            "pores",
+            "pore cleaning",
+            "blackheads",
+            "whiteheads",
+            "clogged pores",
+        ),
+    ),
+    (
+        "microdermabrasion",
+        (
+            "exfoliate my skin",
+            "skin exfoliation",
+            "rough texture",
+            "skin resurfacing",
+            "microderm",
+            "microdermabrasion",
+        ),
+    ),
+    (
+        "laser_hair_removal_face",
+        (
+            "razor bumps",
+            "ingrowns on face",
+            "chin hair",
+            "upper lip hair",
+            "face hair",
+            "facial hair",
+        ),
+    ),
+)
+
+# Flattened in bucket order: a handful of short phrases is cheaper to test with
+# straight `in` checks than with a regex scan
+_SEMANTIC_ALIASES = tuple((key, phrase) for key, phrases in _SEMANTIC_BUCKETS for phrase in phrases)
+
+# Single-word aliases too generic to resolve a one-word message on their own
+_GENERIC_SERVICE_WORDS = frozenset({"laser", "brow", "brows", "lash", "lashes", "facial", "pmu"})
+_GENERIC_REGISTRY_WORDS = _GENERIC_SERVICE_WORDS | {"exfoliate"}
+
+_AMBIGUOUS_PATTERNS = (
+    ("laser", "laser"),
+    ("depilacion laser", "laser"),
+    ("depilación láser", "laser"),
+    ("laser hair removal", "laser"),
+)
+
+_SPECIFIC_INDICATORS = (
+    "full body", "face", "arm", "leg", "brazilian", "bikini",
+    "jawline", "upper lip", "forehead", "cheek", "chin", "neck",
+    "nose", "sideburn", "men", "man", "women", "woman",
+    "lower leg", "lower arm", "chest", "abdomen", "back", "underarm",
+    "upper body", "lower body"
+)
+
 
 class StructuredKnowledgeBase(KnowledgeBasePort):
     def __init__(
@@ -17,48 +90,114 @@ class StructuredKnowledgeBase(KnowledgeBasePort):
         service_facts: dict[str, dict[str, str]] | None = None,
         service_registry: dict[str, dict[str, dict[str, list[str]] | list[str]]] | None = None,
     ) -> None:
-        self._data = data
         self._aliases = aliases
         self._display_names = display_names
-        self._service_facts = service_facts or {}
         self._service_registry = service_registry or SERVICE_REGISTRY
 
+        # Resolve the English fallback up front so lookups are one probe per call.
+        # A service entry without a usable template still shadows "_default".
+        self._templates: dict[tuple[str, str, str], ResponseTemplate | None] = {
+            (intent, service_key, lang): templates.get(lang) or templates.get("en")
+            for intent, bucket in data.items()
+            for service_key, templates in bucket.items()
+            for lang in _LANGUAGES
+        }
+        self._service_facts: dict[tuple[str, str], str | None] = {
+            (service_key, lang): facts.get(lang) or facts.get("en")
+            for service_key, facts in (service_facts or {}).items()
+            for lang in _LANGUAGES
+        }
+        self._canonical_messages: dict[tuple[str, str], list[str] | None] = {
+            (service_key, lang): messages.get(lang) or messages.get("en")
+            for service_key, entry in self._service_registry.items()
+            if isinstance(messages := entry.get("message"), dict)
+            for lang in _LANGUAGES
+        }
+
+        # Alias tables are fixed after construction, so normalize and rank them once
+        alias_index: list[tuple[str, str, int, bool]] = []  # (service, alias, length, generic)
+        for service, service_aliases in aliases.items():
+            for alias in service_aliases:
+                alias_norm = normalize_text(alias)
+                word_count = len(alias_norm.split())
+                is_generic = word_count == 1 and alias_norm in _GENERIC_SERVICE_WORDS
+                alias_index.append((service, alias_norm, word_count, is_generic))
+        alias_index.sort(key=lambda x: (-x[2], x[0]))
+        self._alias_index = tuple(alias_index)
+
+        registry_aliases: list[tuple[str, str, int]] = []  # (key, alias, length)
+        for registry_key, entry in self._service_registry.items():
+            for alias in entry.get("aliases", []):
+                alias_norm = normalize_text(alias)
+                registry_aliases.append((registry_key, alias_norm, len(alias_norm.split())))
+        # Sort by: exact phrase (multi-word) first, then length (longer first), then key
+        registry_aliases.sort(key=lambda x: (-(x[2] > 1), -x[2], x[0]))
+
+        # Word-subset matching works on integer masks: each alias word gets a bit,
+        # and each word maps to the bits of the ranked entries that use it.
+        self._word_bits: dict[str, int] = {}
+        self._word_entries: dict[str, int] = {}
+        registry_index: list[tuple[str, str, int, int, bool]] = []  # (key, alias, length, word mask, generic)
+        for position, (registry_key, alias_norm, word_count) in enumerate(registry_aliases):
+            word_mask = 0
+            for word in alias_norm.split():
+                word_mask |= self._word_bits.setdefault(word, 1 << len(self._word_bits))
+                self._word_entries[word] = self._word_entries.get(word, 0) | (1 << position)
+            is_generic = word_count == 1 and alias_norm in _GENERIC_REGISTRY_WORDS
+            registry_index.append((registry_key, alias_norm, word_count, word_mask, is_generic))
+        self._registry_index = tuple(registry_index)
+
+        # One matcher covers both tables: service alias bits sit below registry bits,
+        # so both resolvers share a single (cached) scan of the same message.
+        self._registry_shift = len(self._alias_index)
+        self._alias_mask = (1 << self._registry_shift) - 1
+        matcher = _index_matcher(entry[1] for entry in (*self._alias_index, *self._registry_index))
+        self._scan_aliases = lru_cache(maxsize=2048)(matcher.scan)
+
+        # Both resolvers depend only on the normalized text, so memoize on that
+        self._resolve_service = lru_cache(maxsize=2048)(self._resolve_service_normalized)
+        self._resolve_registry_key = lru_cache(maxsize=2048)(self._resolve_registry_key_normalized)
+
+        # Messages that are exactly an alias are common, so keep their answers outside
+        # the bounded caches. Resolving through the full path keeps ranking, semantic
+        # buckets and generic-word rules consistent with the resolvers.
+        self._service_by_alias = {
+            alias_norm: self._resolve_service_normalized(alias_norm) for _, alias_norm, *_ in self._alias_index
+        }
+        self._registry_key_by_alias = {
+            alias_norm: self._resolve_registry_key_normalized(alias_norm) for _, alias_norm, *_ in self._registry_index
+        }
+
     def get_template(self, intent: str, service: str | None, language: str) -> ResponseTemplate | None:
-        intent_bucket = self._data.get(intent, {})
         service_key = (service or "").strip().lower()
-        lang = language if language in {"en", "es"} else "en"
+        lang = "es" if language == "es" else "en"
 
-        if service_key and service_key in intent_bucket:
-            return intent_bucket[service_key].get(lang) or intent_bucket[service_key].get("en")
-        if "_default" in intent_bucket:
-            return intent_bucket["_default"].get(lang) or intent_bucket["_default"].get("en")
-        return None
+        if service_key:
+            template = self._templates.get((intent, service_key, lang), _MISSING)
+            if template is not _MISSING:
+                return template
+        return self._templates.get((intent, "_default", lang))
 
     def resolve_service_from_text(self, text: str) -> str | None:
-        normalized = _normalize_text(text)
-
-        candidates: list[tuple[str, str, int]] = []
-        for service, aliases in self._aliases.items():
-            for alias in aliases:
-                alias_norm = _normalize_text(alias)
-                candidates.append((service, alias_norm, len(alias_norm.split())))
-
-        candidates.sort(key=lambda x: (-x[2], x[0]))
-
-        for service, alias_norm, _ in candidates:
-            if alias_norm in normalized:
-                if len(alias_norm.split()) == 1 and len(normalized.split()) == 1:
-                    generic_words = {"laser", "brow", "brows", "lash", "lashes", "facial", "pmu"}
-                    if alias_norm not in generic_words:
-                        return service
-                else:
-                    return service
-
-        for service, alias_norm, _ in candidates:
-            if _fuzzy_match(alias_norm, normalized):
+        normalized = normalize_text(text)
+        service = self._service_by_alias.get(normalized, _MISSING)
+        if service is not _MISSING:
+            return service
+        return self._resolve_service(normalized)
+
+    def _resolve_service_normalized(self, normalized: str) -> str | None:
+        single_word_text = len(normalized.split()) == 1
+
+        # One scan finds every alias in the text; lower bits are higher-ranked aliases
+        hits = self._scan_aliases(normalized) & self._alias_mask
+        while hits:
+            lowest = hits & -hits
+            hits ^= lowest
+            service, _, _, is_generic = self._alias_index[lowest.bit_length() - 1]
+            if not (is_generic and single_word_text):
                 return service
 
-        return None
+        return _first_fuzzy_match(self._alias_index, normalized)
 
     def get_service_facts(self, service: str, language: str) -> str | None:
         """
@@ -66,32 +205,17 @@ class StructuredKnowledgeBase(KnowledgeBasePort):
         Returns the fact text in the specified language, or None if not available.
         """
         service_key = (service or "").strip().lower()
-        lang = language if language in {"en", "es"} else "en"
+        lang = "es" if language == "es" else "en"
 
-        if service_key in self._service_facts:
-            facts = self._service_facts[service_key]
-            return facts.get(lang) or facts.get("en")
-        return None
+        return self._service_facts.get((service_key, lang))
 
     def get_canonical_service_message(self, service_key: str, language: str) -> list[str] | None:
         """
         Get canonical service message lines for a service registry key.
         Returns list of message lines, or None if not available.
         """
-        if service_key not in self._service_registry:
-            return None
-
-        service_entry = self._service_registry[service_key]
-        if "message" not in service_entry:
-            return None
-
-        messages = service_entry["message"]
-        lang = language if language in {"en", "es"} else "en"
-
-        if isinstance(messages, dict):
-            return messages.get(lang) or messages.get("en")
-
-        return None
+        lang = "es" if language == "es" else "en"
+        return self._canonical_messages.get((service_key, lang))
 
     def resolve_service_to_registry_key(self, text: str) -> str | None:
         """
@@ -100,115 +224,67 @@ class StructuredKnowledgeBase(KnowledgeBasePort):
         Includes semantic alias buckets for common user wording.
         Returns registry key (e.g., "laser_hair_removal_full_body") or None.
         """
-        normalized = _normalize_text(text)
-
-        # Semantic alias buckets for common user wording
-        semantic_buckets = {
-            "facial_deep_blackhead_removal": [
-                "deep clean",
-                "deep cleaning",
-                "deep cleanse",
-                "exfoliate",
-                "exfoliation",
-                "exfoliating",
-                "clean pores",
-                "pores",
-                "pore cleaning",
-                "blackheads",
-                "whiteheads",
-                "clogged pores",
-            ],
-            "microdermabrasion": [
-                "exfoliate my skin",
-                "skin exfoliation",
-                "rough texture",
-                "skin resurfacing",
-                "microderm",
-                "microdermabrasion",
-            ],
-            "laser_hair_removal_face": [
-                "razor bumps",
-                "ingrowns on face",
-                "chin hair",
-                "upper lip hair",
-                "face hair",
-                "facial hair",
-            ],
-        }
+        normalized = normalize_text(text)
+        registry_key = self._registry_key_by_alias.get(normalized, _MISSING)
+        if registry_key is not _MISSING:
+            return registry_key
+        return self._resolve_registry_key(normalized)
+
+    def _resolve_registry_key_normalized(self, normalized: str) -> str | None:
 
         # Check semantic buckets first (more specific)
-        for registry_key, semantic_aliases in semantic_buckets.items():
-            for semantic_alias in semantic_aliases:
-                if semantic_alias in normalized:
-                    # Prefer facial_deep_blackhead_removal over microdermabrasion for "exfoliate" unless "microderm" explicitly mentioned
-                    if "exfoliate" in normalized and "microderm" not in normalized:
-                        if registry_key == "microdermabrasion":
-                            continue
-                    return registry_key
-
-        # Build candidates from registry aliases
-        candidates: list[tuple[str, str, int, bool]] = []  # (key, alias, length, is_exact_phrase)
-        for registry_key, entry in self._service_registry.items():
-            aliases = entry.get("aliases", [])
-            for alias in aliases:
-                alias_norm = _normalize_text(alias)
-                is_exact_phrase = len(alias_norm.split()) > 1
-                candidates.append((registry_key, alias_norm, len(alias_norm.split()), is_exact_phrase))
+        for registry_key, semantic_alias in _SEMANTIC_ALIASES:
+            if semantic_alias in normalized:
+                # Prefer facial_deep_blackhead_removal over microdermabrasion for "exfoliate" unless "microderm" explicitly mentioned
+                if registry_key == "microdermabrasion" and "exfoliate" in normalized and "microderm" not in normalized:
+                    continue
+                return registry_key
 
-        # Sort by: exact phrase first, then length (longer first), then key
-        candidates.sort(key=lambda x: (-x[3], -x[2], x[0]))
+        text_words = normalized.split()
+        single_word_text = len(text_words) == 1
 
         # Exact substring matches (prefer longer/more specific)
-        for registry_key, alias_norm, _, is_exact_phrase in candidates:
-            if alias_norm in normalized:
-                # For single-word matches, be more careful with generic words
-                if len(alias_norm.split()) == 1 and len(normalized.split()) == 1:
-                    generic_words = {"laser", "brow", "brows", "lash", "lashes", "facial", "pmu", "exfoliate"}
-                    if alias_norm not in generic_words:
-                        return registry_key
-                else:
-                    return registry_key
-
-        # Token-based contains (check if all words in alias are in text)
-        for registry_key, alias_norm, _, _ in candidates:
-            alias_words = set(alias_norm.split())
-            text_words = set(normalized.split())
-            if alias_words.issubset(text_words) and len(alias_words) > 0:
+        hits = self._scan_aliases(normalized) >> self._registry_shift
+        while hits:
+            lowest = hits & -hits
+            hits ^= lowest
+            registry_key, _, _, _, is_generic = self._registry_index[lowest.bit_length() - 1]
+            # For single-word matches, be more careful with generic words
+            if not (is_generic and single_word_text):
                 return registry_key
 
-        # Fuzzy matches with threshold
-        for registry_key, alias_norm, _, _ in candidates:
-            if _fuzzy_match(alias_norm, normalized, threshold=0.85):
+        # Token-based contains (check if all words in alias are in text).
+        # Only entries sharing a word with the text can qualify.
+        text_mask = 0
+        candidates = 0
+        for word in text_words:
+            bit = self._word_bits.get(word)
+            if bit is not None:
+                text_mask |= bit
+                candidates |= self._word_entries[word]
+        while candidates:
+            lowest = candidates & -candidates
+            candidates ^= lowest
+            registry_key, _, _, word_mask, _ = self._registry_index[lowest.bit_length() - 1]
+            if not word_mask & ~text_mask:
                 return registry_key
 
-        return None
+        # Fuzzy matches with threshold
+        return _first_fuzzy_match(self._registry_index, normalized, threshold=0.85)
 
     def is_ambiguous_category_question(self, text: str) -> str | None:
         """
         Detect ambiguous category questions that need clarification.
         Returns the category name if ambiguous, None otherwise.
         """
-        normalized = _normalize_text(text)
+        normalized = normalize_text(text)
 
-        ambiguous_patterns = {
-            "laser": "laser",
-            "depilacion laser": "laser",
-            "depilación láser": "laser",
-            "laser hair removal": "laser",
-        }
-
-        specific_indicators = [
-            "full body", "face", "arm", "leg", "brazilian", "bikini",
-            "jawline", "upper lip", "forehead", "cheek", "chin", "neck",
-            "nose", "sideburn", "men", "man", "women", "woman",
-            "lower leg", "lower arm", "chest", "abdomen", "back", "underarm",
-            "upper body", "lower body"
-        ]
-
-        for pattern, category in ambiguous_patterns.items():
+        for pattern, category in _AMBIGUOUS_PATTERNS:
             if pattern in normalized:
-                if not any(indicator in normalized for indicator in specific_indicators):
-                    return category
+                # Indicators do not depend on the pattern, so a specific mention rules out every pattern
+                if any(indicator in normalized for indicator in _SPECIFIC_INDICATORS):
+                    return None
+                return category
 
         return None
 
@@ -217,28 +293,50 @@ class StructuredKnowledgeBase(KnowledgeBasePort):
         return self._display_names.get(key, service)
 
 
-def _normalize_text(text: str) -> str:
-    normalized = text.lower().replace("+", " ")
-    normalized = re.sub(r"[^a-z0-9\s]", " ", normalized)
-    normalized = re.sub(r"\s+", " ", normalized).strip()
-    return normalized
+def _index_matcher(ranked_aliases: Iterable[str]) -> KeywordMatcher:
+    # Give each ranked entry its own bit so the lowest set bit is the best match
+    flags: dict[str, int] = {}
+    for position, alias_norm in enumerate(ranked_aliases):
+        flags[alias_norm] = flags.get(alias_norm, 0) | (1 << position)
+    return KeywordMatcher(flags)
 
 
-def _fuzzy_match(alias: str, text: str, threshold: float = 0.88) -> bool:
-    alias_words = alias.split()
+def _first_fuzzy_match(
+    candidates: Iterable[tuple[Any, ...]],
+    text: str,
+    threshold: float = 0.88,
+) -> str | None:
+    """
+    Return the key of the first (key, alias, word_count, ...) candidate whose alias
+    fuzzily matches a same-length word window of text.
+    """
     text_words = text.split()
-    if not alias_words or not text_words:
-        return False
-
-    window = len(alias_words)
-    if len(text_words) < window:
-        return SequenceMatcher(None, alias, text).ratio() >= threshold
+    if not text_words:
+        return None
 
-    for i in range(len(text_words) - window + 1):
-        chunk = " ".join(text_words[i : i + window])
-        if SequenceMatcher(None, alias, chunk).ratio() >= threshold:
-            return True
-    return False
+    # SequenceMatcher caches its analysis of the second sequence, so build one
+    # matcher per text window and only swap the alias in for each candidate.
+    window_matchers: dict[int, list[SequenceMatcher]] = {}
+    for key, alias, window, *_ in candidates:
+        if not window:
+            continue
+        matchers = window_matchers.get(window)
+        if matchers is None:
+            if len(text_words) < window:
+                chunks = [text]
+            else:
+                chunks = [" ".join(text_words[i : i + window]) for i in range(len(text_words) - window + 1)]
+            matchers = window_matchers[window] = [SequenceMatcher(None, "", chunk) for chunk in chunks]
+        for matcher in matchers:
+            matcher.set_seq1(alias)
+            # Cheap upper bounds first: length-only, then character multiset overlap
+            if (
+                matcher.real_quick_ratio() >= threshold
+                and matcher.quick_ratio() >= threshold
+                and matcher.ratio() >= threshold
+            ):
+                return key
+    return None
 
 
 def build_kb() -> StructuredKnowledgeBase:
@@ -510,409 +608,170 @@ def build_kb() -> StructuredKnowledgeBase:
     deposit_hold_en = "Deposit Hold\nPricing: $20"
     deposit_hold_es = "Deposit Hold\nPrecio: $20"
 
+    # Most templates appear under several intents (e.g. pricing and service_details);
+    # build each distinct one once and share it across buckets.
+    shared_templates: dict[tuple[str, tuple[str, ...]], ResponseTemplate] = {}
+
+    def template(text: str, required_substrings: tuple[str, ...]) -> ResponseTemplate:
+        key = (text, required_substrings)
+        existing = shared_templates.get(key)
+        if existing is None:
+            existing = shared_templates[key] = ResponseTemplate(text, required_substrings)
+        return existing
+
+    # Pricing and service-details questions get the same per-service card:
+    # (service key, English text, Spanish text, required substrings)
+    service_cards = (
+        ("facial + deep blackhead removal", facial_en, facial_es, ("LIMITED TIME PROMO", "$120–$150")),
+        ("laser hair removal", laser_en, laser_es, ("$150", "Add full face: $50")),
+        ("eyelash lamination + tinting", lash_promo_en, lash_promo_es, ("LASH LAMINATION PROMO", "$85")),
+        ("eyebrow shaping + lamination + tinting", brow_en, brow_es, ("Eyebrow Shaping + Lamination + Tinting",)),
+        ("full body diode laser", full_body_diode_laser_en, full_body_diode_laser_es, ("$150",)),
+        ("full face laser", full_face_laser_en, full_face_laser_es, ("$50",)),
+        ("full legs", full_legs_en, full_legs_es, ("$60",)),
+        ("lower legs", lower_legs_en, lower_legs_es, ("$35",)),
+        ("full arms", full_arms_en, full_arms_es, ("$50",)),
+        ("lower arms", lower_arms_en, lower_arms_es, ("$30",)),
+        ("chest", chest_en, chest_es, ("$30",)),
+        ("abdomen", abdomen_en, abdomen_es, ("$30",)),
+        ("brazilian bikini", brazilian_bikini_en, brazilian_bikini_es, ("$65",)),
+        ("back", back_en, back_es, ("$45",)),
+        ("underarms", underarms_en, underarms_es, ("$45",)),
+        ("upper lip", upper_lip_en, upper_lip_es, ("$30",)),
+        ("forehead", forehead_en, forehead_es, ("$40",)),
+        ("sideburns cheeks", sideburns_cheeks_en, sideburns_cheeks_es, ("$40",)),
+        ("chin", chin_en, chin_es, ("$30",)),
+        ("neck", neck_en, neck_es, ("$45",)),
+        ("jawline", jawline_en, jawline_es, ("$30",)),
+        ("nose diode laser", nose_diode_laser_en, nose_diode_laser_es, ("$40",)),
+        (
+            "full upper body diode laser men",
+            full_upper_body_diode_laser_men_en,
+            full_upper_body_diode_laser_men_es,
+            ("$250",),
+        ),
+        ("full face laser men", full_face_laser_men_en, full_face_laser_men_es, ("$80",)),
+        ("upper body one part men", upper_body_one_part_men_en, upper_body_one_part_men_es, ("$90",)),
+        ("facelift massage", facelift_massage_en, facelift_massage_es, ("$90",)),
+        ("microdermabrasion", microdermabrasion_en, microdermabrasion_es, ("$180",)),
+        ("lash extensions all shapes", lash_extensions_all_shapes_en, lash_extensions_all_shapes_es, ("$120",)),
+        (
+            "eyebrow lamination tint shaping",
+            eyebrow_lamination_tint_shaping_en,
+            eyebrow_lamination_tint_shaping_es,
+            ("$110",),
+        ),
+        ("eyebrow lamination", eyebrow_lamination_en, eyebrow_lamination_es, ("$85",)),
+        ("eyebrow tinting", eyebrow_tinting_en, eyebrow_tinting_es, ("$85",)),
+        ("eyebrow shaping", eyebrow_shaping_en, eyebrow_shaping_es, ("$85",)),
+        (
+            "facial blackhead removal lash lamination",
+            facial_blackhead_removal_lash_lamination_en,
+            facial_blackhead_removal_lash_lamination_es,
+            ("$155",),
+        ),
+        (
+            "lash lamination eyebrow lamination",
+            lash_lamination_eyebrow_lamination_en,
+            lash_lamination_eyebrow_lamination_es,
+            ("$150",),
+        ),
+        (
+            "facial blackhead removal laser",
+            facial_blackhead_removal_laser_en,
+            facial_blackhead_removal_laser_es,
+            ("$200",),
+        ),
+        (
+            "facial blackhead removal eyebrow lamination",
+            facial_blackhead_removal_eyebrow_lamination_en,
+            facial_blackhead_removal_eyebrow_lamination_es,
+            ("$175",),
+        ),
+        ("pmu lips", pmu_lips_en, pmu_lips_es, ("$300",)),
+        ("pmu eyebrows", pmu_eyebrows_en, pmu_eyebrows_es, ("$350",)),
+        ("pmu eyeliner", pmu_eyeliner_en, pmu_eyeliner_es, ("$250",)),
+        ("lip pmu touchup", lip_pmu_touchup_en, lip_pmu_touchup_es, ("$200",)),
+        ("deposit hold", deposit_hold_en, deposit_hold_es, ("$20",)),
+    )
+    service_templates = {
+        service_key: {"en": template(text_en, required), "es": template(text_es, required)}
+        for service_key, text_en, text_es, required in service_cards
+    }
+
     data: dict[str, dict[str, dict[str, ResponseTemplate]]] = {
         "services_list": {
             "_default": {
-                "en": ResponseTemplate(services_en, ["Laser Hair Removal"]),
-                "es": ResponseTemplate(services_es, ["Laser Hair Removal"]),
+                "en": template(services_en, ("Laser Hair Removal",)),
+                "es": template(services_es, ("Laser Hair Removal",)),
             }
         },
-        "pricing": {
-            "facial + deep blackhead removal": {
-                "en": ResponseTemplate(facial_en, ["LIMITED TIME PROMO", "$120–$150"]),
-                "es": ResponseTemplate(facial_es, ["LIMITED TIME PROMO", "$120–$150"]),
-            },
-            "laser hair removal": {
-                "en": ResponseTemplate(laser_en, ["$150", "Add full face: $50"]),
-                "es": ResponseTemplate(laser_es, ["$150", "Add full face: $50"]),
-            },
-            "eyelash lamination + tinting": {
-                "en": ResponseTemplate(lash_promo_en, ["LASH LAMINATION PROMO", "$85"]),
-                "es": ResponseTemplate(lash_promo_es, ["LASH LAMINATION PROMO", "$85"]),
-            },
-            "eyebrow shaping + lamination + tinting": {
-                "en": ResponseTemplate(brow_en, ["Eyebrow Shaping + Lamination + Tinting"]),
-                "es": ResponseTemplate(brow_es, ["Eyebrow Shaping + Lamination + Tinting"]),
-            },
-            "full body diode laser": {
-                "en": ResponseTemplate(full_body_diode_laser_en, ["$150"]),
-                "es": ResponseTemplate(full_body_diode_laser_es, ["$150"]),
-            },
-            "full face laser": {
-                "en": ResponseTemplate(full_face_laser_en, ["$50"]),
-                "es": ResponseTemplate(full_face_laser_es, ["$50"]),
-            },
-            "full legs": {
-                "en": ResponseTemplate(full_legs_en, ["$60"]),
-                "es": ResponseTemplate(full_legs_es, ["$60"]),
-            },
-            "lower legs": {
-                "en": ResponseTemplate(lower_legs_en, ["$35"]),
-                "es": ResponseTemplate(lower_legs_es, ["$35"]),
-            },
-            "full arms": {
-                "en": ResponseTemplate(full_arms_en, ["$50"]),
-                "es": ResponseTemplate(full_arms_es, ["$50"]),
-            },
-            "lower arms": {
-                "en": ResponseTemplate(lower_arms_en, ["$30"]),
-                "es": ResponseTemplate(lower_arms_es, ["$30"]),
-            },
-            "chest": {
-                "en": ResponseTemplate(chest_en, ["$30"]),
-                "es": ResponseTemplate(chest_es, ["$30"]),
-            },
-            "abdomen": {
-                "en": ResponseTemplate(abdomen_en, ["$30"]),
-                "es": ResponseTemplate(abdomen_es, ["$30"]),
-            },
-            "brazilian bikini": {
-                "en": ResponseTemplate(brazilian_bikini_en, ["$65"]),
-                "es": ResponseTemplate(brazilian_bikini_es, ["$65"]),
-            },
-            "back": {
-                "en": ResponseTemplate(back_en, ["$45"]),
-                "es": ResponseTemplate(back_es, ["$45"]),
-            },
-            "underarms": {
-                "en": ResponseTemplate(underarms_en, ["$45"]),
-                "es": ResponseTemplate(underarms_es, ["$45"]),
-            },
-            "upper lip": {
-                "en": ResponseTemplate(upper_lip_en, ["$30"]),
-                "es": ResponseTemplate(upper_lip_es, ["$30"]),
-            },
-            "forehead": {
-                "en": ResponseTemplate(forehead_en, ["$40"]),
-                "es": ResponseTemplate(forehead_es, ["$40"]),
-            },
-            "sideburns cheeks": {
-                "en": ResponseTemplate(sideburns_cheeks_en, ["$40"]),
-                "es": ResponseTemplate(sideburns_cheeks_es, ["$40"]),
-            },
-            "chin": {
-                "en": ResponseTemplate(chin_en, ["$30"]),
-                "es": ResponseTemplate(chin_es, ["$30"]),
-            },
-            "neck": {
-                "en": ResponseTemplate(neck_en, ["$45"]),
-                "es": ResponseTemplate(neck_es, ["$45"]),
-            },
-            "jawline": {
-                "en": ResponseTemplate(jawline_en, ["$30"]),
-                "es": ResponseTemplate(jawline_es, ["$30"]),
-            },
-            "nose diode laser": {
-                "en": ResponseTemplate(nose_diode_laser_en, ["$40"]),
-                "es": ResponseTemplate(nose_diode_laser_es, ["$40"]),
-            },
-            "full upper body diode laser men": {
-                "en": ResponseTemplate(full_upper_body_diode_laser_men_en, ["$250"]),
-                "es": ResponseTemplate(full_upper_body_diode_laser_men_es, ["$250"]),
-            },
-            "full face laser men": {
-                "en": ResponseTemplate(full_face_laser_men_en, ["$80"]),
-                "es": ResponseTemplate(full_face_laser_men_es, ["$80"]),
-            },
-            "upper body one part men": {
-                "en": ResponseTemplate(upper_body_one_part_men_en, ["$90"]),
-                "es": ResponseTemplate(upper_body_one_part_men_es, ["$90"]),
-            },
-            "facelift massage": {
-                "en": ResponseTemplate(facelift_massage_en, ["$90"]),
-                "es": ResponseTemplate(facelift_massage_es, ["$90"]),
-            },
-            "microdermabrasion": {
-                "en": ResponseTemplate(microdermabrasion_en, ["$180"]),
-                "es": ResponseTemplate(microdermabrasion_es, ["$180"]),
-            },
-            "lash extensions all shapes": {
-                "en": ResponseTemplate(lash_extensions_all_shapes_en, ["$120"]),
-                "es": ResponseTemplate(lash_extensions_all_shapes_es, ["$120"]),
-            },
-            "eyebrow lamination tint shaping": {
-                "en": ResponseTemplate(eyebrow_lamination_tint_shaping_en, ["$110"]),
-                "es": ResponseTemplate(eyebrow_lamination_tint_shaping_es, ["$110"]),
-            },
-            "eyebrow lamination": {
-                "en": ResponseTemplate(eyebrow_lamination_en, ["$85"]),
-                "es": ResponseTemplate(eyebrow_lamination_es, ["$85"]),
-            },
-            "eyebrow tinting": {
-                "en": ResponseTemplate(eyebrow_tinting_en, ["$85"]),
-                "es": ResponseTemplate(eyebrow_tinting_es, ["$85"]),
-            },
-            "eyebrow shaping": {
-                "en": ResponseTemplate(eyebrow_shaping_en, ["$85"]),
-                "es": ResponseTemplate(eyebrow_shaping_es, ["$85"]),
-            },
-            "facial blackhead removal lash lamination": {
-                "en": ResponseTemplate(facial_blackhead_removal_lash_lamination_en, ["$155"]),
-                "es": ResponseTemplate(facial_blackhead_removal_lash_lamination_es, ["$155"]),
-            },
-            "lash lamination eyebrow lamination": {
-                "en": ResponseTemplate(lash_lamination_eyebrow_lamination_en, ["$150"]),
-                "es": ResponseTemplate(lash_lamination_eyebrow_lamination_es, ["$150"]),
-            },
-            "facial blackhead removal laser": {
-                "en": ResponseTemplate(facial_blackhead_removal_laser_en, ["$200"]),
-                "es": ResponseTemplate(facial_blackhead_removal_laser_es, ["$200"]),
-            },
-            "facial blackhead removal eyebrow lamination": {
-                "en": ResponseTemplate(facial_blackhead_removal_eyebrow_lamination_en, ["$175"]),
-                "es": ResponseTemplate(facial_blackhead_removal_eyebrow_lamination_es, ["$175"]),
-            },
-            "pmu lips": {
-                "en": ResponseTemplate(pmu_lips_en, ["$300"]),
-                "es": ResponseTemplate(pmu_lips_es, ["$300"]),
-            },
-            "pmu eyebrows": {
-                "en": ResponseTemplate(pmu_eyebrows_en, ["$350"]),
-                "es": ResponseTemplate(pmu_eyebrows_es, ["$350"]),
-            },
-            "pmu eyeliner": {
-                "en": ResponseTemplate(pmu_eyeliner_en, ["$250"]),
-                "es": ResponseTemplate(pmu_eyeliner_es, ["$250"]),
-            },
-            "lip pmu touchup": {
-                "en": ResponseTemplate(lip_pmu_touchup_en, ["$200"]),
-                "es": ResponseTemplate(lip_pmu_touchup_es, ["$200"]),
-            },
-            "deposit hold": {
-                "en": ResponseTemplate(deposit_hold_en, ["$20"]),
-                "es": ResponseTemplate(deposit_hold_es, ["$20"]),
-            },
-        },
+        "pricing": service_templates,
         "promo_pricing": {
             "_default": {
-                "en": ResponseTemplate(lash_promo_en, ["LASH LAMINATION PROMO", "$85"]),
-                "es": ResponseTemplate(lash_promo_es, ["LASH LAMINATION PROMO", "$85"]),
+                "en": template(lash_promo_en, ("LASH LAMINATION PROMO", "$85")),
+                "es": template(lash_promo_es, ("LASH LAMINATION PROMO", "$85")),
             }
         },
-        "service_details": {
-            "facial + deep blackhead removal": {
-                "en": ResponseTemplate(facial_en, ["LIMITED TIME PROMO", "$120–$150"]),
-                "es": ResponseTemplate(facial_es, ["LIMITED TIME PROMO", "$120–$150"]),
-            },
-            "laser hair removal": {
-                "en": ResponseTemplate(laser_en, ["$150", "Add full face: $50"]),
-                "es": ResponseTemplate(laser_es, ["$150", "Add full face: $50"]),
-            },
-            "eyelash lamination + tinting": {
-                "en": ResponseTemplate(lash_promo_en, ["LASH LAMINATION PROMO", "$85"]),
-                "es": ResponseTemplate(lash_promo_es, ["LASH LAMINATION PROMO", "$85"]),
-            },
-            "eyebrow shaping + lamination + tinting": {
-                "en": ResponseTemplate(brow_en, ["Eyebrow Shaping + Lamination + Tinting"]),
-                "es": ResponseTemplate(brow_es, ["Eyebrow Shaping + Lamination + Tinting"]),
-            },
-            "full body diode laser": {
-                "en": ResponseTemplate(full_body_diode_laser_en, ["$150"]),
-                "es": ResponseTemplate(full_body_diode_laser_es, ["$150"]),
-            },
-            "full face laser": {
-                "en": ResponseTemplate(full_face_laser_en, ["$50"]),
-                "es": ResponseTemplate(full_face_laser_es, ["$50"]),
-            },
-            "full legs": {
-                "en": ResponseTemplate(full_legs_en, ["$60"]),
-                "es": ResponseTemplate(full_legs_es, ["$60"]),
-            },
-            "lower legs": {
-                "en": ResponseTemplate(lower_legs_en, ["$35"]),
-                "es": ResponseTemplate(lower_legs_es, ["$35"]),
-            },
-            "full arms": {
-                "en": ResponseTemplate(full_arms_en, ["$50"]),
-                "es": ResponseTemplate(full_arms_es, ["$50"]),
-            },
-            "lower arms": {
-                "en": ResponseTemplate(lower_arms_en, ["$30"]),
-                "es": ResponseTemplate(lower_arms_es, ["$30"]),
-            },
-            "chest": {
-                "en": ResponseTemplate(chest_en, ["$30"]),
-                "es": ResponseTemplate(chest_es, ["$30"]),
-            },
-            "abdomen": {
-                "en": ResponseTemplate(abdomen_en, ["$30"]),
-                "es": ResponseTemplate(abdomen_es, ["$30"]),
-            },
-            "brazilian bikini": {
-                "en": ResponseTemplate(brazilian_bikini_en, ["$65"]),
-                "es": ResponseTemplate(brazilian_bikini_es, ["$65"]),
-            },
-            "back": {
-                "en": ResponseTemplate(back_en, ["$45"]),
-                "es": ResponseTemplate(back_es, ["$45"]),
-            },
-            "underarms": {
-                "en": ResponseTemplate(underarms_en, ["$45"]),
-                "es": ResponseTemplate(underarms_es, ["$45"]),
-            },
-            "upper lip": {
-                "en": ResponseTemplate(upper_lip_en, ["$30"]),
-                "es": ResponseTemplate(upper_lip_es, ["$30"]),
-            },
-            "forehead": {
-                "en": ResponseTemplate(forehead_en, ["$40"]),
-                "es": ResponseTemplate(forehead_es, ["$40"]),
-            },
-            "sideburns cheeks": {
-                "en": ResponseTemplate(sideburns_cheeks_en, ["$40"]),
-                "es": ResponseTemplate(sideburns_cheeks_es, ["$40"]),
-            },
-            "chin": {
-                "en": ResponseTemplate(chin_en, ["$30"]),
-                "es": ResponseTemplate(chin_es, ["$30"]),
-            },
-            "neck": {
-                "en": ResponseTemplate(neck_en, ["$45"]),
-                "es": ResponseTemplate(neck_es, ["$45"]),
-            },
-            "jawline": {
-                "en": ResponseTemplate(jawline_en, ["$30"]),
-                "es": ResponseTemplate(jawline_es, ["$30"]),
-            },
-            "nose diode laser": {
-                "en": ResponseTemplate(nose_diode_laser_en, ["$40"]),
-                "es": ResponseTemplate(nose_diode_laser_es, ["$40"]),
-            },
-            "full upper body diode laser men": {
-                "en": ResponseTemplate(full_upper_body_diode_laser_men_en, ["$250"]),
-                "es": ResponseTemplate(full_upper_body_diode_laser_men_es, ["$250"]),
-            },
-            "full face laser men": {
-                "en": ResponseTemplate(full_face_laser_men_en, ["$80"]),
-                "es": ResponseTemplate(full_face_laser_men_es, ["$80"]),
-            },
-            "upper body one part men": {
-                "en": ResponseTemplate(upper_body_one_part_men_en, ["$90"]),
-                "es": ResponseTemplate(upper_body_one_part_men_es, ["$90"]),
-            },
-            "facelift massage": {
-                "en": ResponseTemplate(facelift_massage_en, ["$90"]),
-                "es": ResponseTemplate(facelift_massage_es, ["$90"]),
-            },
-            "microdermabrasion": {
-                "en": ResponseTemplate(microdermabrasion_en, ["$180"]),
-                "es": ResponseTemplate(microdermabrasion_es, ["$180"]),
-            },
-            "lash extensions all shapes": {
-                "en": ResponseTemplate(lash_extensions_all_shapes_en, ["$120"]),
-                "es": ResponseTemplate(lash_extensions_all_shapes_es, ["$120"]),
-            },
-            "eyebrow lamination tint shaping": {
-                "en": ResponseTemplate(eyebrow_lamination_tint_shaping_en, ["$110"]),
-                "es": ResponseTemplate(eyebrow_lamination_tint_shaping_es, ["$110"]),
-            },
-            "eyebrow lamination": {
-                "en": ResponseTemplate(eyebrow_lamination_en, ["$85"]),
-                "es": ResponseTemplate(eyebrow_lamination_es, ["$85"]),
-            },
-            "eyebrow tinting": {
-                "en": ResponseTemplate(eyebrow_tinting_en, ["$85"]),
-                "es": ResponseTemplate(eyebrow_tinting_es, ["$85"]),
-            },
-            "eyebrow shaping": {
-                "en": ResponseTemplate(eyebrow_shaping_en, ["$85"]),
-                "es": ResponseTemplate(eyebrow_shaping_es, ["$85"]),
-            },
-            "facial blackhead removal lash lamination": {
-                "en": ResponseTemplate(facial_blackhead_removal_lash_lamination_en, ["$155"]),
-                "es": ResponseTemplate(facial_blackhead_removal_lash_lamination_es, ["$155"]),
-            },
-            "lash lamination eyebrow lamination": {
-                "en": ResponseTemplate(lash_lamination_eyebrow_lamination_en, ["$150"]),
-                "es": ResponseTemplate(lash_lamination_eyebrow_lamination_es, ["$150"]),
-            },
-            "facial blackhead removal laser": {
-                "en": ResponseTemplate(facial_blackhead_removal_laser_en, ["$200"]),
-                "es": ResponseTemplate(facial_blackhead_removal_laser_es, ["$200"]),
-            },
-            "facial blackhead removal eyebrow lamination": {
-                "en": ResponseTemplate(facial_blackhead_removal_eyebrow_lamination_en, ["$175"]),
-                "es": ResponseTemplate(facial_blackhead_removal_eyebrow_lamination_es, ["$175"]),
-            },
-            "pmu lips": {
-                "en": ResponseTemplate(pmu_lips_en, ["$300"]),
-                "es": ResponseTemplate(pmu_lips_es, ["$300"]),
-            },
-            "pmu eyebrows": {
-                "en": ResponseTemplate(pmu_eyebrows_en, ["$350"]),
-                "es": ResponseTemplate(pmu_eyebrows_es, ["$350"]),
-            },
-            "pmu eyeliner": {
-                "en": ResponseTemplate(pmu_eyeliner_en, ["$250"]),
-                "es": ResponseTemplate(pmu_eyeliner_es, ["$250"]),
-            },
-            "lip pmu touchup": {
-                "en": ResponseTemplate(lip_pmu_touchup_en, ["$200"]),
-                "es": ResponseTemplate(lip_pmu_touchup_es, ["$200"]),
-            },
-            "deposit hold": {
-                "en": ResponseTemplate(deposit_hold_en, ["$20"]),
-                "es": ResponseTemplate(deposit_hold_es, ["$20"]),
-            },
-        },
+        "service_details": service_templates,
         "location": {
             "_default": {
-                "en": ResponseTemplate(location_en, ["375 N First St"]),
-                "es": ResponseTemplate(location_es, ["375 N First St"]),
+                "en": template(location_en, ("375 N First St",)),
+                "es": template(location_es, ("375 N First St",)),
             }
         },
         "hours": {
             "_default": {
-                "en": ResponseTemplate(hours_en, ["10:00 AM to 7:00 PM"]),
-                "es": ResponseTemplate(hours_es, ["10:00 AM a 7:00 PM"]),
+                "en": template(hours_en, ("10:00 AM to 7:00 PM",)),
+                "es": template(hours_es, ("10:00 AM a 7:00 PM",)),
             }
         },
         "availability": {
             "_default": {
-                "en": ResponseTemplate(booking_en, ["preferred day and time"]),
-                "es": ResponseTemplate(booking_es, ["dia y hora"]),
+                "en": template(booking_en, ("preferred day and time",)),
+                "es": template(booking_es, ("dia y hora",)),
             }
         },
         "booking": {
             "_default": {
-                "en": ResponseTemplate(booking_en, ["preferred day and time"]),
-                "es": ResponseTemplate(booking_es, ["dia y hora"]),
+                "en": template(booking_en, ("preferred day and time",)),
+                "es": template(booking_es, ("dia y hora",)),
             }
         },
         "equipment": {
             "_default": {
-                "en": ResponseTemplate(equipment_en, ["DM40P"]),
-                "es": ResponseTemplate(equipment_es, ["DM40P"]),
+                "en": template(equipment_en, ("DM40P",)),
+                "es": template(equipment_es, ("DM40P",)),
             }
         },
         "eligibility": {
             "_default": {
-                "en": ResponseTemplate(eligibility_en, ["Tretinoin"]),
-                "es": ResponseTemplate(eligibility_es, ["Tretinoin"]),
+                "en": template(eligibility_en, ("Tretinoin",)),
+                "es": template(eligibility_es, ("Tretinoin",)),
             }
         },
         "closing": {
             "_default": {
-                "en": ResponseTemplate(booking_en, ["preferred day and time"]),
-                "es": ResponseTemplate(booking_es, ["dia y hora"]),
+                "en": template(booking_en, ("preferred day and time",)),
+                "es": template(booking_es, ("dia y hora",)),
             }
         },
         "booking_info": {
             "_default": {
-                "en": ResponseTemplate(booking_info_en, ["Happy to help with booking."]),
-                "es": ResponseTemplate(booking_info_es, ["Con gusto ayudamos con la cita."]),
+                "en": template(booking_info_en, ("Happy to help with booking.",)),
+                "es": template(booking_info_es, ("Con gusto ayudamos con la cita.",)),
             }
         },
         "brazilian_clarification": {
             "laser hair removal": {
-                "en": ResponseTemplate(brazilian_en, ["Brazilian supported"]),
-                "es": ResponseTemplate(brazilian_es, ["Brazilian"]),
+                "en": template(brazilian_en, ("Brazilian supported",)),
+                "es": template(brazilian_es, ("Brazilian",)),
             }
         },
         "laser_clarification": {
             "_default": {
-                "en": ResponseTemplate(laser_clarification_en, ["Laser Hair Removal"]),
-                "es": ResponseTemplate(laser_clarification_es, ["Depilación Láser"]),
+                "en": template(laser_clarification_en, ("Laser Hair Removal",)),
+                "es": template(laser_clarification_es, ("Depilación Láser",)),
             }
         },
     }
@@ -1154,39 +1013,16 @@ def build_kb() -> StructuredKnowledgeBase:
         ],
     }
 
-    display_names = {
-        "facial + deep blackhead removal": "Facial + Deep Blackhead Removal",
-        "laser hair removal": "Laser Hair Removal",
-        "eyelash lamination + tinting": "Eyelash Lamination + Tinting",
-        "eyebrow shaping + lamination + tinting": "Eyebrow Shaping + Lamination + Tinting",
-        "full body diode laser": "Full Body Diode Laser",
-        "full face laser": "Full Face Laser",
-        "full legs": "Full Legs",
-        "lower legs": "Lower Legs",
-        "full arms": "Full Arms",
-        "lower arms": "Lower Arms",
-        "chest": "Chest",
-        "abdomen": "Abdomen",
+    # Most display names are the title-cased key; only the exceptions are spelled out
+    display_name_overrides = {
         "brazilian bikini": "Brazilian (Bikini)",
-        "back": "Back",
-        "underarms": "Underarms",
-        "upper lip": "Upper Lip",
-        "forehead": "Forehead",
         "sideburns cheeks": "Sideburns / Cheeks",
-        "chin": "Chin",
-        "neck": "Neck",
-        "jawline": "Jawline",
         "nose diode laser": "Nose (Diode Laser)",
         "full upper body diode laser men": "Full Upper Body Diode Laser (Men)",
         "full face laser men": "Full Face Laser (Men)",
         "upper body one part men": "Upper Body – One Part (Men)",
-        "facelift massage": "Facelift Massage",
-        "microdermabrasion": "Microdermabrasion",
         "lash extensions all shapes": "Lash Extensions (All Shapes)",
         "eyebrow lamination tint shaping": "Eyebrow Lamination + Tint + Shaping",
-        "eyebrow lamination": "Eyebrow Lamination",
-        "eyebrow tinting": "Eyebrow Tinting",
-        "eyebrow shaping": "Eyebrow Shaping",
         "facial blackhead removal lash lamination": "Facial (Blackhead Removal) + Lash Lamination",
         "lash lamination eyebrow lamination": "Lash Lamination + Eyebrow Lamination",
         "facial blackhead removal laser": "Facial (Blackhead Removal) + Laser",
@@ -1195,38 +1031,22 @@ def build_kb() -> StructuredKnowledgeBase:
         "pmu eyebrows": "PMU – Eyebrows",
         "pmu eyeliner": "PMU – Eyeliner",
         "lip pmu touchup": "Lip PMU Touch-up",
-        "deposit hold": "Deposit Hold",
     }
+    display_names = {key: display_name_overrides.get(key, key.title()) for key in aliases}
 
+    # Every laser package shares the same session guidance
+    six_sessions = {
+        "en": "Most clients need about 6 sessions for best results.",
+        "es": "La mayoría de los clientes necesitan aproximadamente 6 sesiones para mejores resultados.",
+    }
     service_facts: dict[str, dict[str, str]] = {
-        "full body diode laser": {
-            "en": "Most clients need about 6 sessions for best results.",
-            "es": "La mayoría de los clientes necesitan aproximadamente 6 sesiones para mejores resultados.",
-        },
-        "full legs": {
-            "en": "Most clients need about 6 sessions for best results.",
-            "es": "La mayoría de los clientes necesitan aproximadamente 6 sesiones para mejores resultados.",
-        },
-        "lower legs": {
-            "en": "Most clients need about 6 sessions for best results.",
-            "es": "La mayoría de los clientes necesitan aproximadamente 6 sesiones para mejores resultados.",
-        },
-        "full arms": {
-            "en": "Most clients need about 6 sessions for best results.",
-            "es": "La mayoría de los clientes necesitan aproximadamente 6 sesiones para mejores resultados.",
-        },
-        "lower arms": {
-            "en": "Most clients need about 6 sessions for best results.",
-            "es": "La mayoría de los clientes necesitan aproximadamente 6 sesiones para mejores resultados.",
-        },
-        "brazilian bikini": {
-            "en": "Most clients need about 6 sessions for best results.",
-            "es": "La mayoría de los clientes necesitan aproximadamente 6 sesiones para mejores resultados.",
-        },
-        "full upper body diode laser men": {
-            "en": "Most clients need about 6 sessions for best results.",
-            "es": "La mayoría de los clientes necesitan aproximadamente 6 sesiones para mejores resultados.",
-        },
+        "full body diode laser": six_sessions,
+        "full legs": six_sessions,
+        "lower legs": six_sessions,
+        "full arms": six_sessions,
+        "lower arms": six_sessions,
+        "brazilian bikini": six_sessions,
+        "full upper body diode laser men": six_sessions,
     }
 
     return StructuredKnowledgeBase(
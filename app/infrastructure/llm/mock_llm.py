@@ -3,30 +3,41 @@ from __future__ import annotations
 from app.application.ports.llm import LLMPort
 from app.domain.entities.intent import IntentClassification
 
+# Checked in order; the first rule with a keyword in the text wins
+_INTENT_RULES = (
+    (("facial", "blackhead"), "pricing", "Facial + Deep Blackhead Removal"),
+    (("laser",), "pricing", "Laser Hair Removal"),
+    (("lamination", "lash"), "promo_pricing", "Eyelash Lamination + Tinting"),
+    (("hours", "open", "hora", "horario"), "hours", None),
+    (("location", "address", "direccion", "ubicacion"), "location", None),
+)
+_SPANISH_CUES = ("hola", "gracias", "precio", "horario")
+
+
+def _contains_any(text: str, keywords: tuple[str, ...]) -> bool:
+    # A plain loop beats any() over a generator for a handful of keywords
+    for keyword in keywords:
+        if keyword in text:
+            return True
+    return False
+
 
 class MockLLM(LLMPort):
     def classify_intent(self, text: str, language_hint: str | None) -> IntentClassification:
         normalized = text.lower()
-        if any(word in normalized for word in ("facial", "blackhead")):
-            intent = "pricing"
-            service = "Facial + Deep Blackhead Removal"
-        elif "laser" in normalized:
-            intent = "pricing"
-            service = "Laser Hair Removal"
-        elif any(word in normalized for word in ("lamination", "lash")):
-            intent = "promo_pricing"
-            service = "Eyelash Lamination + Tinting"
-        elif any(word in normalized for word in ("hours", "open", "hora", "horario")):
-            intent = "hours"
-            service = None
-        elif any(word in normalized for word in ("location", "address", "direccion", "ubicacion")):
-            intent = "location"
-            service = None
-        else:
-            intent = "services_list"
-            service = None
+        intent = "services_list"
+        service = None
+        for keywords, rule_intent, rule_service in _INTENT_RULES:
+            if _contains_any(normalized, keywords):
+                intent = rule_intent
+                service = rule_service
+                break
 
-        language = "es" if any(word in normalized for word in ("hola", "gracias", "precio", "horario")) else "en"
+        # A supported hint already answers the language question
+        if language_hint in ("en", "es"):
+            language = language_hint
+        else:
+            language = "es" if _contains_any(normalized, _SPANISH_CUES) else "en"
 
         return IntentClassification(
             intent=intent,
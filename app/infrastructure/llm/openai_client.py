@@ -1,18 +1,61 @@
 from __future__ import annotations
 
-from openai import OpenAI
+import asyncio
+from collections.abc import Iterator, Mapping, Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+import httpx
 
 from app.application.exceptions import LLMUpstreamError
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
+
+_JSON_OBJECT: Mapping[str, Any] = {"type": "json_object"}
+
+# The SDK's connection counts, but idle sockets stay open for 60 s instead of its 5 s,
+# so the connection opened by prewarm() is still there for the first customer message
+_POOL_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=60.0)
+
+
+@lru_cache(maxsize=4)
+def _shared_openai(api_key: str) -> OpenAI:
+    """One SDK client (and connection pool) per key, shared by every OpenAIClient."""
+    # Imported here so processes running on MockLLM never load the SDK
+    from openai import DefaultHttpxClient, OpenAI
+
+    # DefaultHttpxClient keeps the SDK's own timeouts and redirect handling
+    return OpenAI(api_key=api_key, http_client=DefaultHttpxClient(limits=_POOL_LIMITS))
+
+
+@lru_cache(maxsize=4)
+def _shared_async_openai(api_key: str) -> AsyncOpenAI:
+    """One async SDK client per key, shared by every AsyncOpenAIClient.
+
+    Its httpx.AsyncClient pool belongs to the event loop that first uses it, so all
+    callers must run on that one loop (the application's), never a fresh asyncio.run().
+    """
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+    return AsyncOpenAI(api_key=api_key, http_client=DefaultAsyncHttpxClient(limits=_POOL_LIMITS))
+
 
 class OpenAIClient:
     def __init__(self, api_key: str) -> None:
-        self._client = OpenAI(api_key=api_key)
+        self._client = _shared_openai(api_key)
+
+    def prewarm(self, model: str) -> None:
+        """Fetch one model's metadata so the pool holds a live TLS connection."""
+        try:
+            self._client.with_options(max_retries=0, timeout=5.0).models.retrieve(model)
+        except Exception as exc:
+            raise LLMUpstreamError(f"OpenAI API error: {exc}") from exc
 
     def chat_text(
         self,
         model: str,
-        messages: list[dict[str, str]],
+        messages: Sequence[Mapping[str, str]],
         temperature: float,
         max_tokens: int,
     ) -> str:
@@ -29,12 +72,35 @@ class OpenAIClient:
         content = (resp.choices[0].message.content or "").strip() if resp.choices else ""
         return content
 
+    def chat_text_stream(
+        self,
+        model: str,
+        messages: Sequence[Mapping[str, str]],
+        temperature: float,
+        max_tokens: int,
+    ) -> Iterator[str]:
+        """Yield reply text as it is generated, for callers that forward it incrementally."""
+        try:
+            stream = self._client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+            )
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as exc:
+            raise LLMUpstreamError(f"OpenAI API error: {exc}") from exc
+
     def chat_json(
         self,
         model: str,
-        messages: list[dict[str, str]],
+        messages: Sequence[Mapping[str, str]],
         temperature: float,
         max_tokens: int,
+        response_format: Mapping[str, Any] = _JSON_OBJECT,
     ) -> str:
         try:
             resp = self._client.chat.completions.create(
@@ -42,10 +108,56 @@ class OpenAIClient:
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
-                response_format={"type": "json_object"},
+                response_format=response_format,
             )
         except Exception as exc:
             raise LLMUpstreamError(f"OpenAI API error: {exc}") from exc
 
         content = (resp.choices[0].message.content or "").strip() if resp.choices else ""
         return content
+
+
+class AsyncOpenAIClient:
+    """Async counterpart of OpenAIClient for overlapping several requests."""
+
+    def __init__(self, api_key: str) -> None:
+        self._client = _shared_async_openai(api_key)
+
+    async def chat_json(
+        self,
+        model: str,
+        messages: Sequence[Mapping[str, str]],
+        temperature: float,
+        max_tokens: int,
+        response_format: Mapping[str, Any] = _JSON_OBJECT,
+    ) -> str:
+        try:
+            resp = await self._client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format=response_format,
+            )
+        except Exception as exc:
+            raise LLMUpstreamError(f"OpenAI API error: {exc}") from exc
+
+        content = (resp.choices[0].message.content or "").strip() if resp.choices else ""
+        return content
+
+    async def chat_json_many(
+        self,
+        model: str,
+        messages_list: Sequence[Sequence[Mapping[str, str]]],
+        temperature: float,
+        max_tokens: int,
+        response_format: Mapping[str, Any] = _JSON_OBJECT,
+    ) -> list[str]:
+        return list(
+            await asyncio.gather(
+                *(
+                    self.chat_json(model, messages, temperature, max_tokens, response_format)
+                    for messages in messages_list
+                )
+            )
+        )
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-import json
+import threading
+from collections import OrderedDict
 from typing import Any
 
+import orjson
+
 from app.application.exceptions import LLMContractError
 from app.application.ports.llm import LLMPort
 from app.core.config import settings
 from app.domain.entities.intent import IntentClassification
-from app.infrastructure.llm.openai_client import OpenAIClient
-from app.infrastructure.llm.prompts import build_intent_prompt
+from app.infrastructure.llm.openai_client import AsyncOpenAIClient, OpenAIClient
+from app.infrastructure.llm.prompts import INTENT_RESPONSE_FORMAT, build_intent_prompt
+
+_CLASSIFICATION_CACHE_SIZE = 2048
 
 
 class OpenAILLM(LLMPort):
@@ -16,42 +21,115 @@ class OpenAILLM(LLMPort):
         if not settings.OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY is required for OpenAILLM.")
         self.client = OpenAIClient(api_key=settings.OPENAI_API_KEY)
+        self._async_client: AsyncOpenAIClient | None = None
+        # Classifications are immutable; at temperature 0 the same input gives the
+        # same answer, so repeats skip the prompt build, the call and the parse.
+        # Both the sync and batch paths read and fill this LRU.
+        self._classifications: OrderedDict[tuple[str, str | None], IntentClassification] = OrderedDict()
+        self._classifications_lock = threading.Lock()
 
     def classify_intent(self, text: str, language_hint: str | None) -> IntentClassification:
-        messages = build_intent_prompt(text)
-        if language_hint:
-            messages.append({"role": "system", "content": f"Language hint: {language_hint}"})
-
-        raw = self.client.chat_json(
-            model=settings.OPENAI_MODEL_CLASSIFY,
-            messages=messages,
-            temperature=settings.OPENAI_TEMPERATURE_CLASSIFY,
-            max_tokens=300,
-        )
-        data = _parse_json(raw, what="intent")
-        if not isinstance(data, dict):
-            raise LLMContractError("Intent: expected JSON object.")
-
-        intent = str(data.get("intent", "")).strip()
-        language = str(data.get("language", "en")).strip().lower()
-        normalized_text = str(data.get("normalized_text", "")).strip()
-        service_raw = data.get("service")
-        service = str(service_raw).strip() if service_raw else None
-
-        if not intent or not normalized_text:
-            raise LLMContractError("Intent: missing required fields.")
-
-        return IntentClassification(
-            intent=intent,
-            language=language,
-            normalized_text=normalized_text,
-            service=service,
-        )
+        key = (text, language_hint)
+        classification = self._cached_classification(key)
+        if classification is None:
+            raw = self.client.chat_json(
+                model=settings.OPENAI_MODEL_CLASSIFY,
+                messages=_intent_messages(text, language_hint),
+                temperature=settings.OPENAI_TEMPERATURE_CLASSIFY,
+                max_tokens=300,
+                response_format=INTENT_RESPONSE_FORMAT,
+            )
+            classification = _parse_intent(raw)
+            self._remember_classification(key, classification)
+        return classification
+
+    def prewarm(self) -> None:
+        self.client.prewarm(settings.OPENAI_MODEL_CLASSIFY)
+
+    async def classify_intents(
+        self,
+        texts: list[str],
+        language_hint: str | None = None,
+    ) -> list[IntentClassification]:
+        """Classify several messages, sending only uncached texts, concurrently.
+
+        Must always be awaited on the same event loop: the shared async SDK client
+        keeps its connection pool, which is bound to the loop that first used it.
+        """
+        results = [self._cached_classification((text, language_hint)) for text in texts]
+        pending: dict[str, list[int]] = {}
+        for index, (text, result) in enumerate(zip(texts, results)):
+            if result is None:
+                pending.setdefault(text, []).append(index)
+
+        if pending:
+            if self._async_client is None:
+                self._async_client = AsyncOpenAIClient(api_key=settings.OPENAI_API_KEY)
+            raws = await self._async_client.chat_json_many(
+                model=settings.OPENAI_MODEL_CLASSIFY,
+                messages_list=[_intent_messages(text, language_hint) for text in pending],
+                temperature=settings.OPENAI_TEMPERATURE_CLASSIFY,
+                max_tokens=300,
+                response_format=INTENT_RESPONSE_FORMAT,
+            )
+            for (text, indexes), raw in zip(pending.items(), raws):
+                classification = _parse_intent(raw)
+                self._remember_classification((text, language_hint), classification)
+                for index in indexes:
+                    results[index] = classification
+
+        return results
+
+    def _cached_classification(self, key: tuple[str, str | None]) -> IntentClassification | None:
+        if settings.OPENAI_TEMPERATURE_CLASSIFY > 0:
+            return None
+        with self._classifications_lock:
+            classification = self._classifications.get(key)
+            if classification is not None:
+                self._classifications.move_to_end(key)
+            return classification
+
+    def _remember_classification(self, key: tuple[str, str | None], classification: IntentClassification) -> None:
+        if settings.OPENAI_TEMPERATURE_CLASSIFY > 0:
+            return
+        with self._classifications_lock:
+            self._classifications[key] = classification
+            if len(self._classifications) > _CLASSIFICATION_CACHE_SIZE:
+                self._classifications.popitem(last=False)
+
+
+def _intent_messages(text: str, language_hint: str | None) -> tuple[dict[str, str], ...]:
+    messages = build_intent_prompt(text)
+    if language_hint:
+        messages += ({"role": "system", "content": f"Language hint: {language_hint}"},)
+    return messages
+
+
+def _parse_intent(raw: str) -> IntentClassification:
+    data = _parse_json(raw, what="intent")
+    if not isinstance(data, dict):
+        raise LLMContractError("Intent: expected JSON object.")
+
+    intent = str(data.get("intent", "")).strip()
+    language = str(data.get("language", "en")).strip().lower()
+    normalized_text = str(data.get("normalized_text", "")).strip()
+    service_raw = data.get("service")
+    service = str(service_raw).strip() if service_raw else None
+
+    if not intent or not normalized_text:
+        raise LLMContractError("Intent: missing required fields.")
+
+    return IntentClassification(
+        intent=intent,
+        language=language,
+        normalized_text=normalized_text,
+        service=service,
+    )
 
 
 def _parse_json(text: str, what: str) -> Any:
     try:
-        return json.loads(text)
+        return orjson.loads(text)
     except Exception:
         snippet = text[:200].replace("\n", " ")
         raise LLMContractError(f"{what.capitalize()}: invalid JSON. Snippet: {snippet!r}")
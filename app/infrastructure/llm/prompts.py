@@ -15,27 +15,49 @@ ALLOWED_INTENTS = [
     "out_of_scope",
 ]
 
+# Structured-output schema for intent classification; the API enforces it server-side
+INTENT_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "intent_classification",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "language": {"type": "string", "enum": ["en", "es"]},
+                "intent": {"type": "string", "enum": ALLOWED_INTENTS},
+                "service": {"type": ["string", "null"]},
+                "normalized_text": {"type": "string"},
+            },
+            "required": ["language", "intent", "service", "normalized_text"],
+            "additionalProperties": False,
+        },
+    },
+}
 
-def build_intent_prompt(text: str) -> list[dict[str, str]]:
-    system = (
-        "You are an intent classifier for a beauty services business.\n"
-        "Return ONLY valid JSON. No markdown. No extra text.\n"
-        "Allowed intents:\n"
-        f"{ALLOWED_INTENTS}\n"
-        "Output schema:\n"
-        "{\n"
-        '  \"language\": \"en\" | \"es\",\n'
-        '  \"intent\": \"...\",\n'
-        '  \"service\": \"...\" | null,\n'
-        '  \"normalized_text\": \"...\"\n'
-        "}\n"
-        "Rules:\n"
-        "- Detect language (en/es).\n"
-        "- normalized_text must be an English translation of the user message.\n"
-        "- If unsure or out of business scope, set intent=out_of_scope.\n"
-        "- service should be a specific service name when relevant (e.g., Laser Hair Removal).\n"
-    )
-    return [
-        {"role": "system", "content": system},
-        {"role": "user", "content": text},
-    ]
+
+# Built once at import: identical for every request, and always ahead of the user text
+_INTENT_SYSTEM_PROMPT = (
+    "You are an intent classifier for a beauty services business.\n"
+    "Return ONLY valid JSON. No markdown. No extra text.\n"
+    "Allowed intents:\n"
+    f"{ALLOWED_INTENTS}\n"
+    "Output schema:\n"
+    "{\n"
+    '  \"language\": \"en\" | \"es\",\n'
+    '  \"intent\": \"...\",\n'
+    '  \"service\": \"...\" | null,\n'
+    '  \"normalized_text\": \"...\"\n'
+    "}\n"
+    "Rules:\n"
+    "- Detect language (en/es).\n"
+    "- normalized_text must be an English translation of the user message.\n"
+    "- If unsure or out of business scope, set intent=out_of_scope.\n"
+    "- service should be a specific service name when relevant (e.g., Laser Hair Removal).\n"
+)
+# Shared by every prompt; message tuples are never mutated after they are built
+_INTENT_SYSTEM_MESSAGE = {"role": "system", "content": _INTENT_SYSTEM_PROMPT}
+
+
+def build_intent_prompt(text: str) -> tuple[dict[str, str], ...]:
+    return (_INTENT_SYSTEM_MESSAGE, {"role": "user", "content": text})
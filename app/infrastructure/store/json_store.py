@@ -5,7 +5,7 @@ import os
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
 
 from app.application.ports.conversation_store import ConversationStorePort
 from app.domain.entities.booking_state import BookingState
@@ -220,7 +220,7 @@ class JsonConversationStore(ConversationStorePort):
         messages = self.get_history(thread_id)
         return messages[-limit:] if messages else []
 
-    def append_message(self, thread_id: str, role: str, text: str, meta: dict[str, Any] | None = None) -> None:
+    def append_message(self, thread_id: str, role: str, text: str, meta: Mapping[str, Any] | None = None) -> None:
         """Append a message to thread history."""
         with self._get_lock(thread_id):
             data = self._load_thread_data(thread_id)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Mapping
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
@@ -22,7 +22,7 @@ class MemoryConversationStore(ConversationStorePort):
     def get_history(self, thread_id: str) -> list[dict[str, Any]]:
         return list(self._threads.get(thread_id, []))
 
-    def append_message(self, thread_id: str, role: str, text: str, meta: dict[str, Any] | None = None) -> None:
+    def append_message(self, thread_id: str, role: str, text: str, meta: Mapping[str, Any] | None = None) -> None:
         self._threads.setdefault(thread_id, [])
         self._threads[thread_id].append(
             {
@@ -1,9 +1,13 @@
+import asyncio
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
 from app.api.webhooks import router as webhooks_router
 from app.core.config import settings
+from app.wiring.dependencies import get_llm
 
 class ContextFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
@@ -26,7 +30,19 @@ root.setLevel(getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO))
 root.handlers.clear()
 root.addHandler(handler)
 
-app = FastAPI(title="Instagram DM Auto Reply", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Pay the LLM's TLS handshake at startup rather than on the first customer message;
+    # building the adapter (SDK import, clients) also happens off the event loop
+    try:
+        await asyncio.to_thread(lambda: get_llm().prewarm())
+    except Exception as e:
+        logging.getLogger(__name__).warning("LLM prewarm failed", extra={"reason": str(e)})
+    yield
+
+
+app = FastAPI(title="Instagram DM Auto Reply", version="1.0.0", lifespan=lifespan)
 
 app.include_router(webhooks_router, tags=["webhooks"])
 
@@ -43,7 +43,9 @@ def get_conversation_store() -> MemoryConversationStore | JsonConversationStore:
     return _conversation_store
 
 
+@lru_cache
 def get_knowledge_base():
+    # The KB is read-only reference data; share one instance (and its resolver caches)
     return build_kb()
 
 
@@ -0,0 +1,75 @@
+"""
+Tests for the Cal.com calendar adapter's slot lookups.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import httpx
+
+from app.infrastructure.calendar.cal_com_client import CalComCalendar
+
+BUSINESS_TZ = ZoneInfo("America/Los_Angeles")
+
+
+def _as_utc(value: str) -> datetime:
+    # Like the upstream API, read a window bound without an offset as UTC
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _stub_calendar(days: list[date], windows: list[tuple[datetime, datetime]]) -> CalComCalendar:
+    # Every half hour across each local day, reported in UTC as Cal.com does
+    slots = []
+    for day in days:
+        local = datetime(day.year, day.month, day.day, tzinfo=BUSINESS_TZ)
+        for step in range(48):
+            slots.append((local + timedelta(minutes=30 * step)).astimezone(timezone.utc))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        start = _as_utc(request.url.params["startTime"])
+        end = _as_utc(request.url.params["endTime"])
+        windows.append((start, end))
+        in_window = [slot.strftime("%Y-%m-%dT%H:%M:%SZ") for slot in slots if start <= slot < end]
+        return httpx.Response(200, json={"slots": in_window})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    return CalComCalendar(
+        api_key="test",
+        calendar_id="1",
+        base_url="https://cal.test",
+        client=client,
+        timezone=BUSINESS_TZ,
+    )
+
+
+def test_batch_matches_single_day_for_non_utc_business_day():
+    """Test that batched and single-day lookups agree on business-local hours."""
+    days = [date(2026, 10, 20), date(2026, 10, 21)]
+    calendar = _stub_calendar(days, [])
+
+    batch = calendar.find_available_slots_batch(days, 30)
+    for day in days:
+        single = calendar.find_available_slots(day, 30)
+        assert batch[day] == single
+        local = [slot.astimezone(BUSINESS_TZ) for slot in single]
+        assert all(slot.date() == day and 9 <= slot.hour < 17 for slot in local)
+        assert local[0].hour == 9 and len(single) == 10
+
+
+def test_query_window_is_sent_in_business_local_time():
+    """Test that the slots request covers the business-local opening hours."""
+    day = date(2026, 10, 20)
+    windows: list[tuple[datetime, datetime]] = []
+    calendar = _stub_calendar([day], windows)
+
+    slots = calendar.find_available_slots(day, 30)
+
+    assert windows == [
+        (datetime(2026, 10, 20, 9, tzinfo=BUSINESS_TZ), datetime(2026, 10, 20, 17, tzinfo=BUSINESS_TZ))
+    ]
+    assert [slot.astimezone(BUSINESS_TZ).strftime("%H:%M") for slot in slots] == [
+        "09:00", "09:30", "10:00", "10:30", "11:00", "11:30", "12:00", "12:30", "13:00", "13:30",
+    ]
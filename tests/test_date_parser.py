@@ -0,0 +1,18 @@
+"""
+Tests for weekday parsing in booking date preferences.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from zoneinfo import ZoneInfo
+
+from app.application.utils.date_parser import parse_date_preference
+
+
+def test_next_weekday_skips_upcoming_occurrence():
+    """Test that 'next friday' lands a week after the upcoming friday."""
+    tz = ZoneInfo("America/Los_Angeles")
+    wednesday = date(2026, 10, 14)
+    assert parse_date_preference("friday", tz, wednesday) == date(2026, 10, 16)
+    assert parse_date_preference("next Friday", tz, wednesday) == date(2026, 10, 23)
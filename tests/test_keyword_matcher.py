@@ -0,0 +1,32 @@
+"""
+Tests for the single-pass keyword matcher used by message rules.
+"""
+
+from __future__ import annotations
+
+from app.application.utils.keyword_matcher import KeywordMatcher
+from app.application.utils.message_rules import (
+    FLAG_DURATION,
+    FLAG_PRICE,
+    FLAG_SESSIONS,
+    FLAG_TIME,
+    classify,
+)
+
+
+def test_scan_matches_any_substring_semantics():
+    """Test that overlapping and prefix keywords all contribute their flags."""
+    matcher = KeywordMatcher({"how much": 1, "how much time": 2, "time": 4, "am": 8})
+    assert matcher.scan("how much time") == 1 | 2 | 4
+    assert matcher.scan("how much is it") == 1
+    assert matcher.scan("sametime") == 4 | 8
+    assert matcher.scan("nothing here") == 0
+
+
+def test_classify_combines_keyword_groups():
+    """Test that classify reports every keyword group in one pass."""
+    flags = classify("How much time does it take? 3pm")
+    assert flags & FLAG_PRICE
+    assert flags & FLAG_DURATION
+    assert flags & FLAG_TIME
+    assert not flags & FLAG_SESSIONS
@@ -0,0 +1,69 @@
+"""
+Tests for the OpenAI intent adapter's batch classification.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from app.application.exceptions import LLMContractError
+from app.core.config import settings
+from app.infrastructure.llm.openai_client import AsyncOpenAIClient
+from app.infrastructure.llm.openai_llm import OpenAILLM
+
+
+class StubAsyncClient:
+    def __init__(self, invalid: set[str] | None = None) -> None:
+        self.sent: list[str] = []
+        self._invalid = invalid or set()
+
+    async def chat_json_many(self, model, messages_list, temperature, max_tokens, response_format):
+        texts = [messages[1]["content"] for messages in messages_list]
+        self.sent.extend(texts)
+        return [
+            "{not json" if text in self._invalid else json.dumps(
+                {"intent": "hours", "language": "en", "service": None, "normalized_text": text}
+            )
+            for text in texts
+        ]
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(settings, "OPENAI_TEMPERATURE_CLASSIFY", 0.0)
+    return OpenAILLM()
+
+
+def test_classify_intents_keeps_order_and_skips_cached_texts(llm):
+    """Test that batch results follow input order and cached texts are not resent."""
+    assert llm._async_client is None
+    llm._async_client = StubAsyncClient()
+
+    first = asyncio.run(llm.classify_intents(["hours?", "where are you"]))
+    assert [c.normalized_text for c in first] == ["hours?", "where are you"]
+
+    second = asyncio.run(llm.classify_intents(["where are you", "price", "hours?", "price"]))
+    assert [c.normalized_text for c in second] == ["where are you", "price", "hours?", "price"]
+    assert llm._async_client.sent == ["hours?", "where are you", "price"]
+    assert second[0] is first[1]
+
+
+def test_classify_intents_raises_contract_error_for_bad_item(llm):
+    """Test that an invalid model response in a batch raises LLMContractError."""
+    llm._async_client = StubAsyncClient(invalid={"broken"})
+
+    with pytest.raises(LLMContractError):
+        asyncio.run(llm.classify_intents(["hours?", "broken"]))
+
+
+def test_async_sdk_client_is_shared_per_key():
+    """Test that async clients for the same key reuse one SDK client and pool."""
+    first = AsyncOpenAIClient(api_key="sk-test")
+    second = AsyncOpenAIClient(api_key="sk-test")
+
+    assert first._client is second._client
+    assert AsyncOpenAIClient(api_key="sk-other")._client is not first._client